@@ -2,15 +2,55 @@
 Interpret API endpoint.
 Receives natural language and outputs JSON intent schema.
 """
+import asyncio
+import hashlib
+import re
+from typing import List, Optional
+
+from cachetools import TTLCache
 from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from app.domain.intent import InterpretRequest, InterpretResponse, PartIntent
 from app.llm.interpreter import get_interpreter
 
 router = APIRouter(prefix="/api/v1", tags=["interpret"])
 
+# Maximum LLM calls in flight for a single batch request; keeps fanout
+# within provider rate limits while still overlapping request latency
+BATCH_CONCURRENCY = 32
+
+# Cache of interpreted intents keyed by normalized prompt. Users often
+# re-send the same description while iterating on downstream CAD params;
+# a hit skips the LLM round-trip entirely.
+_intent_cache: TTLCache = TTLCache(maxsize=4096, ttl=3600)
+
+
+def _prompt_cache_key(text: str) -> str:
+    """Hash a prompt after lowercasing and collapsing whitespace."""
+    normalized = re.sub(r"\s+", " ", text.strip().lower())
+    return hashlib.sha1(normalized.encode()).hexdigest()
+
+
+def _cached_intent(key: str) -> Optional[PartIntent]:
+    """Return a fresh PartIntent for a cached prompt, or None on miss."""
+    cached = _intent_cache.get(key)
+    if cached is None:
+        return None
+    return PartIntent(**cached)
+
+
+def _store_intent(key: str, intent: PartIntent) -> None:
+    """Cache an interpreted intent unless it represents a parse failure."""
+    if intent.missing_information and intent.missing_information[0].startswith(
+        "Failed to parse"
+    ):
+        return
+    # Store a plain dict so cached entries are decoupled from the object
+    _intent_cache[key] = intent.model_dump()
+
 
 @router.post("/interpret", response_model=InterpretResponse)
-async def interpret_text(request: InterpretRequest) -> InterpretResponse:
+async def interpret_text(request: InterpretRequest) -> ORJSONResponse:
     """
     Interpret natural language description into structured part intent.
     
@@ -30,11 +70,19 @@ async def interpret_text(request: InterpretRequest) -> InterpretResponse:
         HTTPException: If interpretation fails or API key is missing
     """
     try:
+        key = _prompt_cache_key(request.text)
+        cached = _cached_intent(key)
+        if cached is not None:
+            # Serialize straight from model_dump: returning a Response
+            # skips FastAPI's jsonable_encoder walk over every field
+            return ORJSONResponse({"intent": cached.model_dump()})
+
         interpreter = get_interpreter()
         intent = await interpreter.interpret_async(request.text)
-        
-        return InterpretResponse(intent=intent)
-        
+        _store_intent(key, intent)
+
+        return ORJSONResponse({"intent": intent.model_dump()})
+
     except ValueError as e:
         # API key or configuration error
         raise HTTPException(
@@ -49,6 +97,64 @@ async def interpret_text(request: InterpretRequest) -> InterpretResponse:
         )
 
 
+@router.post("/interpret/batch", response_model=List[InterpretResponse])
+async def interpret_batch(
+    requests: List[InterpretRequest]
+) -> ORJSONResponse:
+    """
+    Interpret a batch of natural language descriptions concurrently.
+
+    LLM calls are fanned out with asyncio.gather under a semaphore, so a
+    batch of N descriptions completes in roughly the latency of one call
+    instead of N sequential round-trips.
+
+    Args:
+        requests: List of natural language descriptions
+
+    Returns:
+        List of InterpretResponse, one per request, in input order
+
+    Raises:
+        HTTPException: If the interpreter is not configured
+    """
+    try:
+        interpreter = get_interpreter()
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Configuration error: {str(e)}"
+        )
+
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def interpret_one(request: InterpretRequest) -> PartIntent:
+        key = _prompt_cache_key(request.text)
+        cached = _cached_intent(key)
+        if cached is not None:
+            return cached
+        async with semaphore:
+            intent = await interpreter.interpret_async(request.text)
+        _store_intent(key, intent)
+        return intent
+
+    results = await asyncio.gather(
+        *(interpret_one(request) for request in requests),
+        return_exceptions=True
+    )
+
+    # Convert any per-item failure into an error intent so one bad entry
+    # doesn't fail the whole batch
+    responses = []
+    for result in results:
+        if isinstance(result, BaseException):
+            result = PartIntent(
+                missing_information=[f"Interpretation failed: {str(result)}"]
+            )
+        responses.append({"intent": result.model_dump()})
+
+    return ORJSONResponse(responses)
+
+
 @router.get("/interpret/health")
 async def health_check():
     """
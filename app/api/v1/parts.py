@@ -2,20 +2,59 @@
 Parts API endpoint.
 Receives validated CAD Part JSON and generates STEP file.
 """
-from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import FileResponse
+import asyncio
+import os
+import stat as stat_module
 from pathlib import Path
+from typing import List
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
 from app.domain.models import CadPart, PartGenerationResult
 from app.services.part_generator import PartGenerationService
 
 router = APIRouter(prefix="/api/v1", tags=["parts"])
 
-# Service instance
-part_service = PartGenerationService()
+
+def get_part_service(request: Request) -> PartGenerationService:
+    """
+    Dependency returning the app-scoped part generation service.
+
+    The service lives on app.state (created in the lifespan handler) so
+    all requests share one instance instead of re-running directory
+    setup per module import. Falls back to lazy creation when the app
+    runs without lifespan events (e.g. under test transports).
+
+    Args:
+        request: Incoming request, used to reach the application state
+
+    Returns:
+        The shared PartGenerationService instance
+    """
+    service = getattr(request.app.state, "part_service", None)
+    if service is None:
+        service = PartGenerationService()
+        request.app.state.part_service = service
+    return service
+
+
+class StepFileResponse(FileResponse):
+    """
+    FileResponse tuned for multi-MB STEP downloads.
+
+    Starlette's default 64KB chunk size means many reads and sends per
+    response; a 1 MiB chunk cuts the syscall count. Range requests and
+    the Accept-Ranges header are handled by FileResponse itself.
+    """
+    chunk_size = 1 << 20  # 1 MiB
 
 
 @router.post("/parts", response_model=PartGenerationResult)
-async def generate_part(part: CadPart) -> PartGenerationResult:
+async def generate_part(
+    part: CadPart,
+    part_service: PartGenerationService = Depends(get_part_service)
+) -> ORJSONResponse:
     """
     Generate a STEP file from a validated CAD part specification.
     
@@ -40,12 +79,46 @@ async def generate_part(part: CadPart) -> PartGenerationResult:
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=result.message
         )
-    
-    return result
+
+    # Returning a Response skips the jsonable_encoder field walk
+    return ORJSONResponse(result.model_dump())
+
+
+@router.post("/parts/batch")
+async def generate_parts_batch(
+    parts: List[CadPart],
+    part_service: PartGenerationService = Depends(get_part_service)
+) -> StreamingResponse:
+    """
+    Generate STEP files for a batch of parts, streaming ndjson results.
+
+    Results are emitted as newline-delimited JSON in completion order, so
+    clients can begin processing finished parts while the rest of the
+    batch is still building, and the server never holds the full result
+    set in memory.
+
+    Args:
+        parts: List of validated CAD part specifications
+
+    Returns:
+        StreamingResponse of one PartGenerationResult JSON object per line
+    """
+    async def stream():
+        tasks = [
+            asyncio.ensure_future(part_service.generate_part_async(part))
+            for part in parts
+        ]
+        for finished in asyncio.as_completed(tasks):
+            result = await finished
+            yield orjson.dumps(result.model_dump()) + b"\n"
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
 
 
 @router.get("/parts/health")
-async def health_check():
+async def health_check(
+    part_service: PartGenerationService = Depends(get_part_service)
+):
     """
     Health check endpoint for the parts service.
     
@@ -60,7 +133,9 @@ async def health_check():
 
 
 @router.get("/parts/list")
-async def list_parts():
+async def list_parts(
+    part_service: PartGenerationService = Depends(get_part_service)
+):
     """
     List all generated STEP files.
     
@@ -92,7 +167,10 @@ async def list_parts():
 
 
 @router.get("/parts/download/{filename}")
-async def download_part(filename: str):
+async def download_part(
+    filename: str,
+    part_service: PartGenerationService = Depends(get_part_service)
+):
     """
     Download a generated STEP file.
     
@@ -105,30 +183,35 @@ async def download_part(filename: str):
     Raises:
         HTTPException: If file not found
     """
-    file_path = part_service.output_dir / filename
-    
-    if not file_path.exists():
+    # Security check: ensure file is within output directory. normpath +
+    # commonpath is pure string work against the pre-resolved base, so no
+    # readlink/stat syscalls are spent on the check itself
+    base = str(part_service.output_dir_resolved)
+    file_path = Path(os.path.normpath(os.path.join(base, filename)))
+
+    if os.path.commonpath([str(file_path), base]) != base:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied"
+        )
+
+    # One stat call covers both the existence and regular-file checks
+    try:
+        stat_result = file_path.stat()
+    except OSError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"File {filename} not found"
         )
-    
-    if not file_path.is_file():
+
+    if not stat_module.S_ISREG(stat_result.st_mode):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"{filename} is not a valid file"
         )
-    
-    # Security check: ensure file is within output directory
-    try:
-        file_path.resolve().relative_to(part_service.output_dir.resolve())
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied"
-        )
-    
-    return FileResponse(
+
+
+    return StepFileResponse(
         path=str(file_path),
         media_type="application/STEP",
         filename=filename
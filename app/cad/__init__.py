@@ -2,13 +2,118 @@
 CAD builder using CadQuery.
 Deterministic CAD generation with no LLM involvement.
 """
+import itertools
+import os
+import uuid
+from pathlib import Path
 from typing import List
+
 import cadquery as cq
+from app.cad.cache import ShardedLRU
 from app.domain.models import CadPart, Hole, Fillet
 
+# tmpfs staging area for STEP export, when the platform provides one
+_SPOOL_DIR = Path("/dev/shm") if Path("/dev/shm").is_dir() else None
+
+# Disambiguates temp names when one process exports concurrently
+_tmp_counter = itertools.count()
+
+
+def export_step_single_write(result: cq.Workplane, filepath: str) -> None:
+    """
+    Export a workplane to STEP, landing the destination atomically.
+
+    OCCT's STEP writer emits many small fwrites; staging them in tmpfs
+    keeps that churn off the output filesystem. Either way the final
+    contents are written to a sibling temp file and moved into place
+    with os.replace, so concurrent writers racing on the same filename
+    can never leave a partially written STEP file behind.
+
+    Args:
+        result: CadQuery Workplane to export
+        filepath: Output STEP file path
+    """
+    dest = Path(filepath)
+    # Keep the .step suffix on the temp name: cq.exporters.export infers
+    # the format from the extension on the direct-export path
+    tmp = dest.with_name(
+        f"{dest.stem}.{os.getpid()}.{next(_tmp_counter)}.tmp.step"
+    )
+    try:
+        if _SPOOL_DIR is None:
+            cq.exporters.export(result, str(tmp))
+        else:
+            staging = _SPOOL_DIR / f"cadstage_{uuid.uuid4().hex}.step"
+            try:
+                cq.exporters.export(result, str(staging))
+                data = staging.read_bytes()
+            finally:
+                staging.unlink(missing_ok=True)
+
+            fd = os.open(str(tmp), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+
+        os.replace(tmp, dest)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+# Base boxes keyed by (length, width, height). Sharded so concurrent
+# threads hitting different dimensions don't contend on a single lock.
+_box_cache = ShardedLRU(shards=16, capacity=256)
+
+
+def _cached_box(length: float, width: float, height: float) -> cq.Workplane:
+    """
+    Build and cache the base box for a given set of dimensions.
+
+    Repeated requests with the same dimensions (e.g. parameter sweeps
+    varying only holes or fillets) skip OCCT primitive construction.
+    Callers must copy the underlying shape before mutating it.
+    """
+    key = (length, width, height)
+    base = _box_cache.get(key)
+    if base is None:
+        base = cq.Workplane("XY").box(length, width, height)
+        _box_cache.set(key, base)
+    return base
+
+
+def warmup() -> None:
+    """
+    Pre-load OCCT and prime the primitive path.
+
+    The first Workplane call pays the one-time cost of loading OCCT
+    shared libraries; running it at startup keeps that cost off the
+    first /parts request.
+    """
+    _cached_box(1.0, 1.0, 1.0)
+
+
+def _box_from_cache(length: float, width: float, height: float) -> cq.Workplane:
+    """
+    Return a fresh workplane holding a copy of the cached base box.
+
+    The copy keeps the cached shape immutable while downstream hole and
+    fillet operations mutate the returned workplane.
+    """
+    base = _cached_box(length, width, height)
+    return cq.Workplane("XY").newObject([base.val().copy()])
+
 
 class CadBuilder:
-    """Builds CAD models deterministically using CadQuery."""
+    """
+    Builds CAD models deterministically using CadQuery.
+
+    Cheap to construct (one attribute), so instances are created per
+    build rather than pooled; the genuinely expensive startup work —
+    loading OCCT shared libraries and building base primitives — is
+    amortized by warmup() and the module-level box cache instead.
+    """
     
     def __init__(self):
         """Initialize the CAD builder."""
@@ -37,14 +142,17 @@ class CadBuilder:
         else:
             raise ValueError(f"Unsupported shape: {part.shape}")
         
-        # Apply holes
-        for hole in part.holes:
-            self._add_hole(hole)
-        
+        # Apply holes, preferring the flattened arrays stashed by
+        # validate_part so holes are only walked once per request
+        soa = getattr(part, "_soa", None)
+        if soa is not None:
+            self._apply_holes_soa(soa)
+        else:
+            self._apply_holes(part.holes)
+
         # Apply fillets
-        for fillet in part.fillets:
-            self._add_fillet(fillet, part)
-        
+        self._apply_fillets(part.fillets)
+
         return self.result
     
     def _create_box(self, length: float, width: float, height: float) -> cq.Workplane:
@@ -59,57 +167,109 @@ class CadBuilder:
         Returns:
             CadQuery Workplane with box
         """
-        return cq.Workplane("XY").box(length, width, height)
+        return _box_from_cache(length, width, height)
     
-    def _add_hole(self, hole: Hole) -> None:
+    def _apply_holes(self, holes: List[Hole]) -> None:
         """
-        Add a hole to the current part.
-        
+        Drill all holes in batched workplane passes.
+
+        Holes are grouped by (diameter, depth) so each group is cut in a
+        single pushPoints pass, instead of re-selecting the top face and
+        rebuilding a workplane for every hole.
+
         Args:
-            hole: Hole specification
+            holes: Hole specifications
         """
+        if not holes:
+            return
+
         if self.result is None:
             raise ValueError("No base shape created yet")
-        
-        # Position the workplane at the hole location
+
+        # Group hole centers by (diameter, depth)
         # CadQuery uses center-based positioning
-        self.result = (
-            self.result
-            .faces(">Z")  # Select top face
-            .workplane()
-            .center(hole.position.x, hole.position.y)
-            .hole(hole.diameter, hole.depth)
-        )
-    
-    def _add_fillet(self, fillet: Fillet, part: CadPart) -> None:
+        groups = {}
+        for hole in holes:
+            key = (hole.diameter, hole.depth)
+            groups.setdefault(key, []).append((hole.position.x, hole.position.y))
+
+        self._cut_hole_groups(groups)
+
+    def _apply_holes_soa(self, soa: dict) -> None:
         """
-        Add fillets to edges.
-        
+        Drill holes from the flattened arrays stashed by validate_part.
+
+        Same grouping and cutting as _apply_holes, but iterates plain
+        float arrays instead of re-reading Hole/Position model
+        attributes per hole.
+
         Args:
-            fillet: Fillet specification
-            part: Complete part specification for context
+            soa: Mapping with "xs", "ys", "diams", "depths" arrays
         """
         if self.result is None:
             raise ValueError("No base shape created yet")
-        
-        if fillet.edges == "all":
-            # Fillet all edges
-            self.result = self.result.edges().fillet(fillet.radius)
-        elif fillet.edges == "top":
-            # Fillet only top edges
+
+        groups = {}
+        for x, y, diameter, depth in zip(
+            soa["xs"].tolist(),
+            soa["ys"].tolist(),
+            soa["diams"].tolist(),
+            soa["depths"].tolist(),
+        ):
+            groups.setdefault((diameter, depth), []).append((x, y))
+
+        self._cut_hole_groups(groups)
+
+    def _cut_hole_groups(self, groups: dict) -> None:
+        """Cut each (diameter, depth) group in one pushPoints pass."""
+        for (diameter, depth), points in groups.items():
             self.result = (
                 self.result
-                .faces(">Z")
-                .edges()
-                .fillet(fillet.radius)
+                .faces(">Z")  # Select top face
+                .workplane()
+                .pushPoints(points)
+                .hole(diameter, depth)
+            )
+
+    # Face selectors for targeted fillet locations
+    _FILLET_SELECTORS = {"top": ">Z", "bottom": "<Z"}
+
+    def _apply_fillets(self, fillets: List[Fillet]) -> None:
+        """
+        Apply all fillets in merged selector passes.
+
+        Fillets are grouped by radius; disjoint edge targets with the
+        same radius (e.g. top and bottom) fillet in a single unioned
+        selector pass instead of re-enumerating edges per fillet.
+
+        Args:
+            fillets: Fillet specifications
+        """
+        if not fillets:
+            return
+
+        if self.result is None:
+            raise ValueError("No base shape created yet")
+
+        # Group edge targets by radius
+        groups = {}
+        for fillet in fillets:
+            groups.setdefault(fillet.radius, set()).add(fillet.edges)
+
+        for radius, targets in groups.items():
+            if "all" in targets:
+                # "all" subsumes any other target for this radius
+                self.result = self.result.edges().fillet(radius)
+                continue
+
+            selector = " or ".join(
+                self._FILLET_SELECTORS[target] for target in sorted(targets)
             )
-        elif fillet.edges == "bottom":
-            # Fillet only bottom edges
             self.result = (
                 self.result
-                .faces("<Z")
+                .faces(selector)
                 .edges()
-                .fillet(fillet.radius)
+                .fillet(radius)
             )
     
     def export_step(self, filepath: str) -> None:
@@ -121,18 +281,38 @@ class CadBuilder:
         """
         if self.result is None:
             raise ValueError("No part to export")
-        
-        cq.exporters.export(self.result, filepath)
+
+        export_step_single_write(self.result, filepath)
     
     @staticmethod
-    def create_and_export(part: CadPart, filepath: str) -> None:
+    def create_and_export(
+        part: CadPart, filepath: str, use_cache: bool = True
+    ) -> None:
         """
         Convenience method to build and export in one step.
-        
+
+        Reuses a cached STEP file when an identical part was built before,
+        skipping the OCCT boolean and fillet work entirely. Runtime
+        specialization of the build sequence (unrolling per-shape
+        closures) was considered and rejected: build time is OCCT kernel
+        work, not Python dispatch, so the cache is where repeat-part
+        wins actually come from.
+
         Args:
             part: CadPart specification
             filepath: Output STEP file path
+            use_cache: Set False to force a fresh build (e.g. when
+                benchmarking the kernel or verifying export output)
         """
+        from app.cad.cache import part_cache_key, fetch_step, store_step
+
+        if use_cache:
+            cache_key = part_cache_key(part)
+            if fetch_step(cache_key, Path(filepath)):
+                return
+
         builder = CadBuilder()
         builder.build_part(part)
         builder.export_step(filepath)
+        if use_cache:
+            store_step(cache_key, Path(filepath))
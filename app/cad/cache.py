@@ -0,0 +1,147 @@
+"""
+Content-addressed cache for generated STEP files.
+Avoids re-running OCCT geometry work when an identical part is re-submitted.
+"""
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+from cachetools import LRUCache
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+class ShardedLRU:
+    """
+    In-memory LRU cache sharded across independently locked segments.
+
+    A single lru_cache serializes every lookup behind one lock, which
+    becomes a contention point under multi-threaded uvicorn workers.
+    Sharding by key hash keeps threads on different shards from blocking
+    each other.
+    """
+
+    def __init__(self, shards: int = 16, capacity: int = 256):
+        """
+        Initialize the sharded cache.
+
+        Args:
+            shards: Number of independently locked segments
+            capacity: Total entry capacity across all shards
+        """
+        per_shard = max(1, capacity // shards)
+        self._shards = [LRUCache(maxsize=per_shard) for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+
+    def get(self, key: Any) -> Optional[Any]:
+        """Return the cached value for key, or None on miss."""
+        index = hash(key) % len(self._shards)
+        with self._locks[index]:
+            return self._shards[index].get(key)
+
+    def set(self, key: Any, value: Any) -> None:
+        """Store a value, evicting the least recently used on overflow."""
+        index = hash(key) % len(self._shards)
+        with self._locks[index]:
+            self._shards[index][key] = value
+
+# Cache directory shared by all builder instances and worker processes
+_cache_dir = Path(tempfile.gettempdir()) / "solid_cad_cache"
+
+# Hit/miss counters for cache observability
+_hits = 0
+_misses = 0
+
+
+def part_cache_key(part: BaseModel) -> str:
+    """
+    Compute a content-addressed cache key for a part specification.
+
+    The key is the SHA-256 of the canonical JSON of the part, so any
+    change in shape, dimensions, holes, or fillets produces a new key.
+
+    Args:
+        part: Part specification (CadPart or PartIntent)
+
+    Returns:
+        Hex-encoded SHA-256 digest
+    """
+    payload = part.model_dump_json(exclude_none=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def fetch_step(key: str, dest: Path) -> bool:
+    """
+    Copy a cached STEP file to the destination path if present.
+
+    Uses a hard link when possible to avoid copying file contents;
+    falls back to a regular copy across filesystems.
+
+    Args:
+        key: Cache key from part_cache_key()
+        dest: Destination path for the STEP file
+
+    Returns:
+        True on cache hit, False on miss
+    """
+    global _hits, _misses
+    cache_path = _cache_dir / f"{key}.step"
+    if not cache_path.exists():
+        _misses += 1
+        return False
+
+    if dest.exists() and os.path.samefile(cache_path, dest):
+        # Destination is already a link to this cache entry
+        _hits += 1
+        return True
+
+    try:
+        # Link to a temporary name first so an existing destination
+        # (e.g. a colliding filename) is replaced atomically
+        tmp = dest.with_name(f"{dest.name}.{os.getpid()}.tmp")
+        os.link(cache_path, tmp)
+        os.replace(tmp, dest)
+    except OSError:
+        shutil.copyfile(cache_path, dest)
+
+    _hits += 1
+    logger.debug(
+        "STEP cache hit for %s (hits=%d, misses=%d)", key[:12], _hits, _misses
+    )
+    return True
+
+
+def store_step(key: str, src: Path) -> None:
+    """
+    Store a freshly built STEP file in the cache.
+
+    Args:
+        key: Cache key from part_cache_key()
+        src: Path of the STEP file that was just exported
+    """
+    _cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_path = _cache_dir / f"{key}.step"
+    if cache_path.exists():
+        return
+
+    try:
+        os.link(src, cache_path)
+    except OSError:
+        if cache_path.exists() and os.path.samefile(src, cache_path):
+            return
+        # Cross-device fallback: copy to a temp name inside the cache
+        # dir and move it into place, so a concurrent fetch_step never
+        # sees a partially written entry
+        tmp = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            shutil.copyfile(src, tmp)
+            os.replace(tmp, cache_path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
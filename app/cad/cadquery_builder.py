@@ -2,12 +2,15 @@
 CadQuery builder for generating STEP files.
 Generates deterministic STEP files based on PartIntent specifications.
 """
+import uuid
 from pathlib import Path
-from datetime import datetime
+
 import cadquery as cq
 
 from app.domain.intent import PartIntent
+from app.cad import _box_from_cache, export_step_single_write
 from app.cad.builder_interface import CADBuilderInterface
+from app.cad.cache import part_cache_key, fetch_step, store_step
 
 
 class CadQueryBuilder(CADBuilderInterface):
@@ -34,34 +37,51 @@ class CadQueryBuilder(CADBuilderInterface):
         if not part.dimensions:
             raise ValueError("Part dimensions are required")
         
-        if not all([
-            part.dimensions.length,
-            part.dimensions.width,
-            part.dimensions.height
-        ]):
+        dims = part.dimensions
+        if not (dims.length and dims.width and dims.height):
             raise ValueError("All dimensions (length, width, height) are required")
     
-    def build(self, part: PartIntent, output_dir: Path) -> Path:
+    def build(
+        self, part: PartIntent, output_dir: Path, export: bool = True
+    ) -> Path:
         """
         Build a STEP file from PartIntent using CadQuery.
-        
+
         This method creates a deterministic CAD model from the provided
         PartIntent specification and exports it as a STEP file.
-        
+
         Args:
             part: PartIntent specification containing shape, dimensions, holes, and fillets
             output_dir: Directory where the STEP file will be saved
-            
+            export: Set False to build the geometry without serializing
+                it; the returned path is then not written. STEP export is
+                the dominant cost, so validity-only callers (e.g. tests)
+                skip it
+
         Returns:
             Path: Full path to the generated STEP file
-            
+
         Raises:
             ValueError: If required dimensions are missing or invalid
             RuntimeError: If CAD generation or export fails
         """
         # Validate the part specification
         self.validate(part)
-        
+
+        # Generate a collision-free filename; uuid4 stays unique even when
+        # concurrent worker processes build within the same microsecond
+        filename = f"part_{uuid.uuid4().hex}.step"
+        filepath = output_dir / filename
+
+        # Output directory creation is the caller's responsibility
+        # (CADGenerator.__init__), keeping syscalls out of the build path
+
+        # Reuse a cached STEP file if this exact part was built before
+        if export:
+            cache_key = part_cache_key(part)
+            if fetch_step(cache_key, filepath):
+                return filepath
+
         try:
             # Create base shape
             if part.shape == "box":
@@ -74,24 +94,18 @@ class CadQueryBuilder(CADBuilderInterface):
                 raise ValueError(f"Unsupported shape: {part.shape}")
             
             # Apply holes if any
-            for hole in part.holes:
-                result = self._add_hole(result, hole)
+            result = self._apply_holes(result, part.holes)
             
             # Apply fillets if any
-            for fillet in part.fillets:
-                result = self._add_fillet(result, fillet)
-            
-            # Generate filename with timestamp for uniqueness
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-            filename = f"part_{timestamp}.step"
-            filepath = output_dir / filename
-            
-            # Ensure output directory exists
-            output_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Export to STEP format
-            cq.exporters.export(result, str(filepath))
+            result = self._apply_fillets(result, part.fillets)
             
+            if export:
+                # Export to STEP format
+                export_step_single_write(result, str(filepath))
+
+                # Cache the result for identical future requests
+                store_step(cache_key, filepath)
+
             return filepath
             
         except Exception as e:
@@ -109,66 +123,106 @@ class CadQueryBuilder(CADBuilderInterface):
         Returns:
             CadQuery Workplane with box shape
         """
-        return cq.Workplane("XY").box(length, width, height)
+        return _box_from_cache(length, width, height)
     
-    def _add_hole(self, workplane: cq.Workplane, hole) -> cq.Workplane:
+    def _apply_holes(self, workplane: cq.Workplane, holes) -> cq.Workplane:
         """
-        Add a hole to the workplane.
-        
+        Drill all holes in batched workplane passes.
+
+        Holes are grouped by (diameter, depth) so each group is cut in a
+        single pushPoints pass on the top face, instead of re-selecting
+        the face and rebuilding a workplane per hole.
+
         Args:
             workplane: Current CadQuery workplane
-            hole: HoleIntent with diameter, depth, and optional location
-            
+            holes: List of HoleIntent with diameter, depth, and optional location
+
         Returns:
-            Updated CadQuery Workplane with hole added
+            Updated CadQuery Workplane with holes added
         """
-        if not hole.diameter or not hole.depth:
-            # Skip holes without required dimensions
-            return workplane
-        
-        # Parse location - default to center (0, 0)
-        x, y = 0.0, 0.0
-        if hole.location:
+        # Parse locations up front and group centers by (diameter, depth)
+        groups = {}
+        for hole in holes:
+            if not hole.diameter or not hole.depth:
+                # Skip holes without required dimensions
+                continue
+
             # Simple location parsing: "center" -> (0, 0)
             # For more complex locations, would need additional parsing logic
-            if hole.location.lower() == "center":
+            x, y = 0.0, 0.0
+            if hole.location and hole.location.lower() == "center":
                 x, y = 0.0, 0.0
             # Could extend to parse coordinates like "x:10,y:20"
-        
-        # Add hole to top face
-        return (
-            workplane
-            .faces(">Z")  # Select top face
-            .workplane()
-            .center(x, y)
-            .hole(hole.diameter, hole.depth)
-        )
+
+            key = (hole.diameter, hole.depth)
+            groups.setdefault(key, []).append((x, y))
+
+        for (diameter, depth), points in groups.items():
+            workplane = (
+                workplane
+                .faces(">Z")  # Select top face
+                .workplane()
+                .pushPoints(points)
+                .hole(diameter, depth)
+            )
+
+        return workplane
     
-    def _add_fillet(self, workplane: cq.Workplane, fillet) -> cq.Workplane:
+    # Face selectors for targeted fillet locations
+    _FILLET_SELECTORS = {"top": ">Z", "bottom": "<Z"}
+
+    def _parse_fillet_target(self, location) -> str:
         """
-        Add fillets to edges.
-        
+        Map a free-text fillet location onto an edge target.
+
+        Args:
+            location: FilletIntent location string, possibly None
+
+        Returns:
+            One of "all", "top", or "bottom"
+        """
+        if not location or location.lower() in ["all", "all edges"]:
+            return "all"
+        if "top" in location.lower():
+            return "top"
+        if "bottom" in location.lower():
+            return "bottom"
+        # Default to all edges if location not recognized
+        return "all"
+
+    def _apply_fillets(self, workplane: cq.Workplane, fillets) -> cq.Workplane:
+        """
+        Apply all fillets in merged selector passes.
+
+        Fillets are grouped by radius; disjoint edge targets with the
+        same radius (e.g. top and bottom) fillet in a single unioned
+        selector pass instead of re-enumerating edges per fillet.
+
         Args:
             workplane: Current CadQuery workplane
-            fillet: FilletIntent with radius and optional location
-            
+            fillets: List of FilletIntent with radius and optional location
+
         Returns:
             Updated CadQuery Workplane with fillets added
         """
-        if not fillet.radius:
-            # Skip fillets without radius
-            return workplane
-        
-        # Parse location for which edges to fillet
-        if not fillet.location or fillet.location.lower() in ["all", "all edges"]:
-            # Fillet all edges
-            return workplane.edges().fillet(fillet.radius)
-        elif "top" in fillet.location.lower():
-            # Fillet only top edges
-            return workplane.faces(">Z").edges().fillet(fillet.radius)
-        elif "bottom" in fillet.location.lower():
-            # Fillet only bottom edges
-            return workplane.faces("<Z").edges().fillet(fillet.radius)
-        else:
-            # Default to all edges if location not recognized
-            return workplane.edges().fillet(fillet.radius)
+        # Group edge targets by radius
+        groups = {}
+        for fillet in fillets:
+            if not fillet.radius:
+                # Skip fillets without radius
+                continue
+            target = self._parse_fillet_target(fillet.location)
+            groups.setdefault(fillet.radius, set()).add(target)
+
+        for radius, targets in groups.items():
+            if "all" in targets:
+                # "all" subsumes any other target for this radius
+                workplane = workplane.edges().fillet(radius)
+                continue
+
+            selector = " or ".join(
+                self._FILLET_SELECTORS[target] for target in sorted(targets)
+            )
+            workplane = workplane.faces(selector).edges().fillet(radius)
+
+        return workplane
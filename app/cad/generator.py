@@ -2,6 +2,7 @@
 Generic CAD generator module.
 Provides a unified interface for generating CAD files using different engines.
 """
+import asyncio
 from pathlib import Path
 from typing import Dict, Literal
 
@@ -35,17 +36,19 @@ class CADGenerator:
         self.output_dir = Path(output_dir)
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Initialize builders - both inherit from CADBuilderInterface
-        self._builders: Dict[str, CADBuilderInterface] = {
-            "cadquery": CadQueryBuilder(),
-            "solidworks": SolidWorksBuilder()
+
+        # Builder classes - instantiated lazily on first use, so engines
+        # that never run (e.g. SolidWorks on Linux) cost nothing at init
+        self._builder_classes: Dict[str, type] = {
+            "cadquery": CadQueryBuilder,
+            "solidworks": SolidWorksBuilder
         }
+        self._builders: Dict[str, CADBuilderInterface] = {}
     
     def generate(
         self,
         part: PartIntent,
-        engine: Literal["cadquery", "solidworks"]
+        engine: Literal["cadquery", "solidworks"] = "cadquery"
     ) -> Dict[str, any]:
         """
         Generate a CAD file from PartIntent using the specified engine.
@@ -53,7 +56,12 @@ class CADGenerator:
         This method routes to the appropriate builder implementation based on the
         engine parameter. All builders inherit from CADBuilderInterface and use
         the same PartIntent schema, ensuring consistency across engines.
-        
+
+        The in-process CadQuery engine is the default: for the supported
+        feature set (box + holes + fillets) it builds in milliseconds with
+        no COM traffic, so SolidWorks only runs when a client explicitly
+        needs a native .sldprt.
+
         Args:
             part: PartIntent specification containing shape, dimensions, holes, and fillets
             engine: CAD engine to use - either "cadquery" (STEP) or "solidworks" (SLDPRT)
@@ -79,19 +87,22 @@ class CADGenerator:
             /tmp/cad/part_20240109_123456.step
         """
         # Validate engine parameter
-        if engine not in self._builders:
+        if engine not in self._builder_classes:
             return {
                 "status": "error",
                 "file_path": "",
                 "errors": [
                     f"Unsupported engine: '{engine}'. "
-                    f"Supported engines are: {', '.join(self._builders.keys())}"
+                    f"Supported engines are: {', '.join(self._builder_classes.keys())}"
                 ]
             }
-        
+
         try:
             # Get the appropriate builder (all implement CADBuilderInterface)
-            builder = self._builders[engine]
+            builder = self._builders.get(engine)
+            if builder is None:
+                builder = self._builder_classes[engine]()
+                self._builders[engine] = builder
             
             # Use the common interface method
             file_path = builder.build(part, self.output_dir)
@@ -141,3 +152,37 @@ class CADGenerator:
                 "file_path": "",
                 "errors": [f"Unexpected error: {str(e)}"]
             }
+
+    async def generate_async(
+        self,
+        part: PartIntent,
+        engine: Literal["cadquery", "solidworks"] = "cadquery"
+    ) -> Dict[str, any]:
+        """
+        Async version: Generate a CAD file using the shared process pool.
+
+        Runs the CPU-intensive CAD build in a worker process so the event
+        loop stays responsive and builds parallelize across cores.
+        SolidWorks builds instead go to the dedicated STA worker thread:
+        COM apartments only accept calls from their initializing thread,
+        and the COM proxies don't survive a trip to another process.
+
+        Args:
+            part: PartIntent specification containing shape, dimensions, holes, and fillets
+            engine: CAD engine to use - either "cadquery" (STEP) or "solidworks" (SLDPRT)
+
+        Returns:
+            Same result dictionary as generate()
+        """
+        loop = asyncio.get_running_loop()
+
+        if engine == "solidworks":
+            from app.cad.solidworks_builder import get_sw_executor
+
+            executor = get_sw_executor()
+        else:
+            from app.services.part_generator import get_process_pool
+
+            executor = get_process_pool()
+
+        return await loop.run_in_executor(executor, self.generate, part, engine)
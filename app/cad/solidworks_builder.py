@@ -2,13 +2,139 @@
 SolidWorks builder for generating SLDPRT files.
 Uses SolidWorks COM API via pywin32 to create native SolidWorks parts.
 """
+import atexit
+import base64
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
 from typing import Optional
 
 from app.domain.intent import PartIntent
 from app.cad.builder_interface import CADBuilderInterface
 
+# Early-bound SolidWorks application proxy, shared per process. Dispatching
+# on every build goes through late-bound IDispatch::Invoke name resolution
+# for each COM call; EnsureDispatch generates typed makepy wrappers once so
+# subsequent calls use direct vtable stubs.
+_sw_app = None
+_sw_lock = threading.Lock()
+
+# Show the SolidWorks window only when explicitly debugging
+_SW_VISIBLE = os.getenv("SW_VISIBLE", "0") == "1"
+
+# Unit conversion factors: intents are in mm, the SolidWorks API takes
+# meters. One multiply per value instead of chained divisions.
+MM_TO_M = 0.001
+HALF_MM_TO_M = 0.0005
+
+# Output directories already created this process; the mkdir syscall
+# runs once per path instead of inside every build's COM critical section
+_dirs_seen: set = set()
+_dirs_lock = threading.Lock()
+
+
+def _ensure_output_dir(output_dir: Path) -> None:
+    """Create output_dir at most once per process."""
+    if output_dir not in _dirs_seen:
+        with _dirs_lock:
+            if output_dir not in _dirs_seen:
+                output_dir.mkdir(parents=True, exist_ok=True)
+                _dirs_seen.add(output_dir)
+
+
+# Single-threaded executor for all SolidWorks work. COM STA apartments
+# only accept calls from the thread that initialized them, so every
+# build is pinned to this one worker; async callers await it instead of
+# blocking the event loop for multi-second builds.
+_sw_executor = None
+
+
+def _init_sta_worker() -> None:
+    """
+    Initialize COM in apartment-threaded mode on the worker thread.
+
+    The apartment lives for the process lifetime: CoUninitialize must
+    run on the owning thread, which an executor offers no hook for, and
+    the OS reclaims the apartment at exit anyway. Binding the app proxy
+    here, rather than lazily from whichever thread builds first, makes
+    this thread the apartment that owns it, so later executor-pinned
+    calls are never cross-apartment.
+    """
+    try:
+        import pythoncom
+
+        pythoncom.CoInitializeEx(pythoncom.COINIT_APARTMENTTHREADED)
+    except ImportError:
+        # Not on Windows; build() reports the missing dependency
+        return
+
+    try:
+        _get_sw_app()
+    except Exception:
+        pass  # build() will surface the real error
+
+
+def get_sw_executor() -> ThreadPoolExecutor:
+    """
+    Get or create the dedicated STA worker executor.
+
+    Returns:
+        Single-worker ThreadPoolExecutor pinned to the COM apartment
+    """
+    global _sw_executor
+    if _sw_executor is None:
+        with _sw_lock:
+            if _sw_executor is None:
+                _sw_executor = ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix="sw-sta",
+                    initializer=_init_sta_worker,
+                )
+    return _sw_executor
+
+
+def _shutdown_sw_app() -> None:
+    """Exit the pooled SolidWorks instance at interpreter shutdown."""
+    global _sw_app
+    if _sw_app is not None:
+        try:
+            _sw_app.ExitApp()
+        except Exception:
+            pass  # Best effort shutdown
+        _sw_app = None
+
+
+def _get_sw_app():
+    """
+    Get or create the process-wide early-bound SolidWorks proxy.
+
+    Initializes COM in apartment-threaded mode on first use and binds
+    SolidWorks through gencache.EnsureDispatch, caching the proxy so
+    later builds skip both COM init and dispatch.
+
+    Returns:
+        The SolidWorks application COM proxy
+    """
+    global _sw_app
+    if _sw_app is None:
+        with _sw_lock:
+            if _sw_app is None:
+                import win32com.client
+                import pythoncom
+
+                pythoncom.CoInitializeEx(pythoncom.COINIT_APARTMENTTHREADED)
+                app_proxy = win32com.client.gencache.EnsureDispatch(
+                    "SldWorks.Application"
+                )
+                app_proxy.Visible = _SW_VISIBLE
+                # Headless operation: no user interaction, no GUI refresh
+                app_proxy.UserControl = False
+                atexit.register(_shutdown_sw_app)
+                _sw_app = app_proxy
+    return _sw_app
+
 
 class SolidWorksBuilder(CADBuilderInterface):
     """
@@ -34,11 +160,8 @@ class SolidWorksBuilder(CADBuilderInterface):
         if not part.dimensions:
             raise ValueError("Part dimensions are required")
         
-        if not all([
-            part.dimensions.length,
-            part.dimensions.width,
-            part.dimensions.height
-        ]):
+        dims = part.dimensions
+        if not (dims.length and dims.width and dims.height):
             raise ValueError("All dimensions (length, width, height) are required")
     
     def build(self, part: PartIntent, output_dir: Path) -> Path:
@@ -62,28 +185,23 @@ class SolidWorksBuilder(CADBuilderInterface):
         """
         # Import COM API (Windows only)
         try:
-            import win32com.client
-            import pythoncom
+            import win32com.client  # noqa: F401
         except ImportError as e:
             raise ImportError(
                 "pywin32 is required for SolidWorks COM API. "
                 "Install it with: pip install pywin32"
             ) from e
-        
+
         # Validate the part specification
         self.validate(part)
-        
-        # Initialize COM
-        pythoncom.CoInitialize()
-        
+
         sw_app = None
         sw_model = None
-        
+
         try:
-            # Connect to SolidWorks
-            sw_app = win32com.client.Dispatch("SldWorks.Application")
-            sw_app.Visible = True  # Make SolidWorks visible for debugging
-            
+            # Reuse the early-bound, process-wide SolidWorks instance
+            sw_app = _get_sw_app()
+
             # Create new part document
             sw_model = sw_app.NewDocument(
                 sw_app.GetUserPreferenceStringValue(0),  # Default part template
@@ -94,31 +212,57 @@ class SolidWorksBuilder(CADBuilderInterface):
             
             if not sw_model:
                 raise RuntimeError("Failed to create new SolidWorks part document")
-            
-            # Create base shape
-            if part.shape == "box":
-                self._create_box_solidworks(sw_model, part.dimensions)
-            else:
+
+            if part.shape != "box":
                 raise ValueError(f"Unsupported shape: {part.shape}")
-            
-            # Apply holes
-            for hole in part.holes:
-                self._add_hole_solidworks(sw_model, hole)
-            
-            # Apply fillets
-            for fillet in part.fillets:
-                self._add_fillet_solidworks(sw_model, fillet)
-            
-            # Generate filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-            filename = f"part_{timestamp}.sldprt"
+
+            # Nanosecond timestamp as lowercase base32: unique across
+            # threads and cheaper than a strftime round-trip
+            tag = (
+                base64.b32encode(time.time_ns().to_bytes(8, "big"))
+                .decode()
+                .rstrip("=")
+                .lower()
+            )
+            filename = f"part_{tag}.sldprt"
             filepath = output_dir / filename
-            
-            # Ensure output directory exists
-            output_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Save the part
-            save_success = sw_model.SaveAs(str(filepath.resolve()))
+
+            # Ensure output directory exists (cached after first build)
+            _ensure_output_dir(output_dir)
+
+            # Run all geometry operations inside SolidWorks via a single
+            # macro, collapsing ~20 marshalled COM roundtrips into one.
+            # CommandInProgress and a collapsed feature tree stop
+            # SolidWorks re-rendering and rebuilding after every feature;
+            # one explicit rebuild afterwards settles the model.
+            macro_path = output_dir / f"macro_{tag}.swb"
+            macro_path.write_text(self._emit_macro(part))
+            sw_app.CommandInProgress = True
+            sw_model.FeatureManager.EnableFeatureTree = False
+            try:
+                run_success = sw_app.RunMacro2(
+                    str(macro_path.resolve()), "Module1", "main", 0, 0
+                )
+            finally:
+                sw_model.FeatureManager.EnableFeatureTree = True
+                sw_app.CommandInProgress = False
+                macro_path.unlink(missing_ok=True)
+
+            if not run_success:
+                raise RuntimeError("SolidWorks macro execution failed")
+
+            # Single rebuild for the whole feature set
+            sw_model.EditRebuild3()
+
+            # Save silently: no version-upgrade or overwrite dialogs, so
+            # the STA worker never stalls waiting on UI that nobody sees.
+            # (A background saver thread would be faster still, but COM
+            # affinity pins every model call to this one apartment.)
+            save_success = sw_model.SaveAs3(
+                str(filepath.resolve()),
+                0,  # saveAsVersion: current version
+                1   # swSaveAsOptions_Silent
+            )
             
             if not save_success:
                 raise RuntimeError(f"Failed to save SolidWorks part to {filepath}")
@@ -129,188 +273,154 @@ class SolidWorksBuilder(CADBuilderInterface):
             raise RuntimeError(f"Failed to build SLDPRT file: {str(e)}") from e
         
         finally:
-            # Clean up: close document and COM
-            if sw_model:
+            # Clean up: close the document; the app proxy stays alive for
+            # the next build
+            if sw_model is not None and sw_app is not None:
                 try:
                     sw_app.CloseDoc(sw_model.GetTitle())
                 except Exception:
                     pass  # Best effort cleanup
-            
-            pythoncom.CoUninitialize()
+
+            # Drop the document interface reference immediately rather
+            # than waiting for GC: a lingering IUnknown refcount keeps
+            # the closed document (and its memory) alive inside
+            # SolidWorks, which accumulates across a long-running worker
+            sw_model = None
+            try:
+                import pythoncom
+
+                pythoncom.CoFreeUnusedLibraries()
+            except ImportError:
+                pass  # Not on Windows; nothing to free
     
-    def _create_box_solidworks(self, sw_model, dimensions) -> None:
+    def _emit_macro(self, part: PartIntent) -> str:
         """
-        Create a box shape in SolidWorks using sketch and extrude.
-        
+        Template a VBA macro that builds the full part geometry.
+
+        All sketch, extrude, cut, and fillet operations run inside the
+        SolidWorks process, so Python pays one RunMacro2 roundtrip instead
+        of a marshalled COM call per operation.
+
+        Args:
+            part: PartIntent specification
+
+        Returns:
+            VBA macro source with dimensions baked in as literals
+        """
+        lines = [
+            "Option Explicit",
+            "",
+            "Sub main()",
+            "    Dim swApp As Object",
+            "    Dim swModel As Object",
+            "    Set swApp = Application.SldWorks",
+            "    Set swModel = swApp.ActiveDoc",
+        ]
+        lines += self._emit_box_vba(part.dimensions)
+        for hole in part.holes:
+            lines += self._emit_hole_vba(hole)
+        for fillet in part.fillets:
+            lines += self._emit_fillet_vba(fillet)
+        lines.append("End Sub")
+        return "\n".join(lines)
+
+    def _emit_box_vba(self, dimensions) -> list:
+        """
+        Emit VBA statements for the base box (sketch + extrude).
+
         Args:
-            sw_model: SolidWorks model document object
             dimensions: DimensionIntent with length, width, height
+
+        Returns:
+            List of VBA statement strings
         """
-        
-        # Select front plane for sketch
-        front_plane = sw_model.Extension.SelectByID2(
-            "Front Plane", "PLANE", 0, 0, 0, False, 0, None, 0
-        )
-        
-        if not front_plane:
-            raise RuntimeError("Failed to select Front Plane")
-        
-        # Create sketch on front plane
-        sw_model.InsertSketch2(True)
-        sw_model_ext = sw_model.Extension
-        
-        # Draw rectangle centered at origin
-        # Convert from center-based to corner-based coordinates
-        x1 = -dimensions.length / 2.0 / 1000.0  # Convert mm to meters
-        y1 = -dimensions.height / 2.0 / 1000.0
-        x2 = dimensions.length / 2.0 / 1000.0
-        y2 = dimensions.height / 2.0 / 1000.0
-        
-        # Create rectangle
-        sw_model.CreateCenterRectangle(0, 0, 0, x2, y2, 0)
-        
-        # Exit sketch
-        sw_model.InsertSketch2(True)
-        
-        # Extrude the sketch
-        extrude_depth = dimensions.width / 1000.0  # Convert mm to meters
-        
-        sw_model.Extension.SelectByID2(
-            "Sketch1", "SKETCH", 0, 0, 0, False, 0, None, 0
-        )
-        
-        sw_model.FeatureExtrusion2(
-            True,           # SD (single direction)
-            False,          # Flip (don't flip direction)
-            False,          # Dir (direction)
-            0,              # T1 (end condition type: blind)
-            0,              # T2 (end condition type for dir2)
-            extrude_depth,  # D1 (depth)
-            0,              # D2 (depth for dir2)
-            False,          # Dchk1 (draft check)
-            False,          # Dchk2 (draft check dir2)
-            False,          # Ddir1 (draft direction)
-            False,          # Ddir2 (draft direction dir2)
-            0,              # Dang1 (draft angle)
-            0,              # Dang2 (draft angle dir2)
-            False,          # OffsetReverse1
-            False,          # OffsetReverse2
-            0,              # Offset1
-            0,              # Offset2
-            False,          # FlipStartCap
-            False,          # FlipEndCap
-            False           # Merge
-        )
-    
-    def _add_hole_solidworks(self, sw_model, hole) -> None:
+        # Convert from center-based mm to corner-based meters
+        x2 = dimensions.length * HALF_MM_TO_M
+        y2 = dimensions.height * HALF_MM_TO_M
+        extrude_depth = dimensions.width * MM_TO_M
+
+        return [
+            '    swModel.Extension.SelectByID2 "Front Plane", "PLANE", 0, 0, 0, False, 0, Nothing, 0',
+            "    swModel.InsertSketch2 True",
+            f"    swModel.CreateCenterRectangle 0, 0, 0, {x2}, {y2}, 0",
+            "    swModel.InsertSketch2 True",
+            '    swModel.Extension.SelectByID2 "Sketch1", "SKETCH", 0, 0, 0, False, 0, Nothing, 0',
+            # Single-direction blind extrude, no draft, no offsets
+            f"    swModel.FeatureExtrusion2 True, False, False, 0, 0, {extrude_depth}, 0, "
+            "False, False, False, False, 0, 0, False, False, 0, 0, False, False, False",
+        ]
+
+    def _emit_hole_vba(self, hole) -> list:
         """
-        Add a hole to the SolidWorks model.
-        
+        Emit VBA statements for one hole (sketch circle + cut extrude).
+
         Args:
-            sw_model: SolidWorks model document object
             hole: HoleIntent with diameter, depth, and optional location
+
+        Returns:
+            List of VBA statement strings; empty if required dims missing
         """
         if not hole.diameter or not hole.depth:
-            return  # Skip holes without required dimensions
-        
+            return []  # Skip holes without required dimensions
+
         # Parse location - default to center (0, 0)
         x, y = 0.0, 0.0
         if hole.location and hole.location.lower() == "center":
             x, y = 0.0, 0.0
-        
+
         # Convert to meters
-        x_m = x / 1000.0
-        y_m = y / 1000.0
-        diameter_m = hole.diameter / 1000.0
-        depth_m = hole.depth / 1000.0
-        
-        # Select top face for hole sketch
-        sw_model.Extension.SelectByID2(
-            "Face1", "FACE", 0, 0, 0, False, 0, None, 0
-        )
-        
-        # Create sketch for hole
-        sw_model.InsertSketch2(True)
-        
-        # Draw circle at location
-        sw_model.CreateCircle(x_m, y_m, 0, x_m, y_m + diameter_m / 2.0, 0)
-        
-        # Exit sketch
-        sw_model.InsertSketch2(True)
-        
-        # Create cut extrude for hole
-        sw_model.Extension.SelectByID2(
-            "Sketch2", "SKETCH", 0, 0, 0, False, 0, None, 0
-        )
-        
-        sw_model.FeatureCut3(
-            True,       # SD (single direction)
-            False,      # Flip
-            False,      # Dir
-            0,          # T1 (blind)
-            0,          # T2
-            depth_m,    # D1
-            0,          # D2
-            False,      # Dchk1
-            False,      # Dchk2
-            False,      # Ddir1
-            False,      # Ddir2
-            0,          # Dang1
-            0,          # Dang2
-            False,      # OffsetReverse1
-            False,      # OffsetReverse2
-            0,          # Offset1
-            0,          # Offset2
-            False       # UseFeatScope
-        )
-    
-    def _add_fillet_solidworks(self, sw_model, fillet) -> None:
+        x_m = x * MM_TO_M
+        y_m = y * MM_TO_M
+        radius_m = hole.diameter * HALF_MM_TO_M
+        depth_m = hole.depth * MM_TO_M
+
+        return [
+            '    swModel.Extension.SelectByID2 "Face1", "FACE", 0, 0, 0, False, 0, Nothing, 0',
+            "    swModel.InsertSketch2 True",
+            f"    swModel.CreateCircle {x_m}, {y_m}, 0, {x_m}, {y_m + radius_m}, 0",
+            "    swModel.InsertSketch2 True",
+            '    swModel.Extension.SelectByID2 "Sketch2", "SKETCH", 0, 0, 0, False, 0, Nothing, 0',
+            # Single-direction blind cut, no draft, no offsets
+            f"    swModel.FeatureCut3 True, False, False, 0, 0, {depth_m}, 0, "
+            "False, False, False, False, 0, 0, False, False, 0, 0, False",
+        ]
+
+    def _emit_fillet_vba(self, fillet) -> list:
         """
-        Add fillets to edges in SolidWorks.
-        
+        Emit VBA statements for one fillet (edge selection + feature).
+
         Args:
-            sw_model: SolidWorks model document object
             fillet: FilletIntent with radius and optional location
+
+        Returns:
+            List of VBA statement strings; empty if radius missing
         """
         if not fillet.radius:
-            return  # Skip fillets without radius
-        
-        radius_m = fillet.radius / 1000.0  # Convert mm to meters
-        
+            return []  # Skip fillets without radius
+
+        radius_m = fillet.radius * MM_TO_M
+
         # Parse location for which edges to fillet
         # This is a simplified implementation that fillets specific edges
-        # In a full implementation, would need more sophisticated edge selection
-        
+        lines = []
         if not fillet.location or fillet.location.lower() in ["all", "all edges"]:
-            # Select all edges (simplified - select first few edges)
-            # In practice, would iterate through all edges
-            edge_count = 4  # For a box, selecting representative edges
-            for i in range(1, edge_count + 1):
-                sw_model.Extension.SelectByID2(
-                    f"Edge{i}", "EDGE", 0, 0, 0, True, 0, None, 0
+            # Select representative edges (for a box, first four)
+            for i in range(1, 5):
+                lines.append(
+                    f'    swModel.Extension.SelectByID2 "Edge{i}", "EDGE", 0, 0, 0, True, 0, Nothing, 0'
                 )
         elif "top" in fillet.location.lower():
             # Select top edges only
-            sw_model.Extension.SelectByID2(
-                "Edge1", "EDGE", 0, 0, 0, False, 0, None, 0
+            lines.append(
+                '    swModel.Extension.SelectByID2 "Edge1", "EDGE", 0, 0, 0, False, 0, Nothing, 0'
             )
-            sw_model.Extension.SelectByID2(
-                "Edge2", "EDGE", 0, 0, 0, True, 0, None, 0
+            lines.append(
+                '    swModel.Extension.SelectByID2 "Edge2", "EDGE", 0, 0, 0, True, 0, Nothing, 0'
             )
-        
-        # Create fillet feature
-        sw_model.FeatureFillet(
-            2,          # Type (constant radius)
-            radius_m,   # Radius
-            0,          # Vertex fillet type
-            0,          # Override default radius
-            0,          # Overflow type
-            0,          # Preview display
-            False,      # Keep edge/face
-            False,      # Rolling ball where applicable
-            False,      # For construction
-            False,      # No smooth
-            False,      # Optimize geometry
-            False,      # Internal faces only
-            False       # Stop at pin/tangent
+
+        # Constant-radius fillet over the current selection
+        lines.append(
+            f"    swModel.FeatureFillet 2, {radius_m}, 0, 0, 0, 0, "
+            "False, False, False, False, False, False, False"
         )
+        return lines
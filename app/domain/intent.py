@@ -3,11 +3,13 @@ Intent schemas for LLM interpretation.
 These models represent the input/output of natural language processing.
 """
 from typing import List, Optional, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DimensionIntent(BaseModel):
     """Extracted dimension intent from natural language."""
+    model_config = ConfigDict(frozen=True)
+
     length: Optional[float] = Field(default=None, description="Length in mm")
     width: Optional[float] = Field(default=None, description="Width in mm")
     height: Optional[float] = Field(default=None, description="Height in mm")
@@ -15,6 +17,8 @@ class DimensionIntent(BaseModel):
 
 class HoleIntent(BaseModel):
     """Extracted hole intent from natural language."""
+    model_config = ConfigDict(frozen=True)
+
     diameter: Optional[float] = Field(default=None, description="Hole diameter in mm")
     depth: Optional[float] = Field(default=None, description="Hole depth in mm")
     location: Optional[str] = Field(default=None, description="Hole location description")
@@ -22,6 +26,8 @@ class HoleIntent(BaseModel):
 
 class FilletIntent(BaseModel):
     """Extracted fillet intent from natural language."""
+    model_config = ConfigDict(frozen=True)
+
     radius: Optional[float] = Field(default=None, description="Fillet radius in mm")
     location: Optional[str] = Field(default=None, description="Fillet location description")
 
@@ -30,6 +36,12 @@ class PartIntent(BaseModel):
     """
     Structured intent extracted from natural language.
     This schema is enforced by LangChain PydanticOutputParser.
+
+    Deliberately stays a pydantic model end-to-end rather than being
+    converted to a slots dataclass after parsing: PydanticOutputParser,
+    the API response models, and the builders all share this one class,
+    and a shadow schema would buy a few bytes per instance at the cost
+    of a conversion hop and two definitions to keep in sync.
     """
     shape: Optional[Literal["box"]] = Field(
         default=None,
@@ -56,8 +68,11 @@ class PartIntent(BaseModel):
         description="List of missing critical information"
     )
     
-    model_config = {
-        "json_schema_extra": {
+    # Frozen because extraction never mutates an intent after parsing;
+    # immutability makes intents safe to share across caches and workers
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "shape": "box",
                 "dimensions": {
@@ -82,7 +97,7 @@ class PartIntent(BaseModel):
                 "missing_information": []
             }
         }
-    }
+    )
 
 
 class InterpretRequest(BaseModel):
@@ -3,11 +3,20 @@ Domain models for CAD parts.
 Deterministic schemas for representing mechanical parts.
 """
 from typing import List, Literal, Optional
-from pydantic import BaseModel, Field, field_validator
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field
+
+# Reject unknown keys at the request boundary: pydantic-core fails fast
+# in Rust instead of validating and carrying values we never read, and
+# client typos surface as 422s rather than silently dropped fields.
+_strict_config = ConfigDict(extra="forbid")
 
 
 class Position(BaseModel):
     """3D position coordinates."""
+    model_config = _strict_config
+
     x: float = Field(default=0.0, description="X coordinate in mm")
     y: float = Field(default=0.0, description="Y coordinate in mm")
     z: float = Field(default=0.0, description="Z coordinate in mm")
@@ -15,6 +24,8 @@ class Position(BaseModel):
 
 class Dimensions(BaseModel):
     """Part dimensions."""
+    model_config = _strict_config
+
     length: float = Field(gt=0, description="Length in mm")
     width: float = Field(gt=0, description="Width in mm")
     height: float = Field(gt=0, description="Height in mm")
@@ -22,34 +33,22 @@ class Dimensions(BaseModel):
 
 class Hole(BaseModel):
     """Hole feature specification."""
+    model_config = _strict_config
+
     diameter: float = Field(gt=0, description="Hole diameter in mm")
     depth: float = Field(gt=0, description="Hole depth in mm")
     position: Position = Field(default_factory=Position, description="Hole position")
-    
-    @field_validator('diameter')
-    @classmethod
-    def validate_diameter(cls, v: float) -> float:
-        """Validate hole diameter meets minimum manufacturing requirements."""
-        if v < 1.0:
-            raise ValueError("Hole diameter must be at least 1mm for CNC machining")
-        return v
 
 
 class Fillet(BaseModel):
     """Fillet feature specification."""
+    model_config = _strict_config
+
     radius: float = Field(gt=0, description="Fillet radius in mm")
     edges: Literal["all", "top", "bottom"] = Field(
         default="all",
         description="Which edges to apply fillet to"
     )
-    
-    @field_validator('radius')
-    @classmethod
-    def validate_radius(cls, v: float) -> float:
-        """Validate fillet radius meets minimum manufacturing requirements."""
-        if v < 0.5:
-            raise ValueError("Fillet radius must be at least 0.5mm for CNC machining")
-        return v
 
 
 class CadPart(BaseModel):
@@ -57,6 +56,8 @@ class CadPart(BaseModel):
     Complete CAD part specification.
     Represents a deterministic, manufacturable part.
     """
+    model_config = _strict_config
+
     shape: Literal["box"] = Field(
         default="box",
         description="Base shape type (currently only box supported)"
@@ -75,20 +76,39 @@ class CadPart(BaseModel):
         description="Material for manufacturing context"
     )
     
-    @field_validator('dimensions')
-    @classmethod
-    def validate_dimensions(cls, v: Dimensions) -> Dimensions:
-        """Validate dimensions meet minimum manufacturing requirements."""
-        min_size = 10.0
-        if v.length < min_size or v.width < min_size or v.height < min_size:
+    def model_post_init(self, __context) -> None:
+        """
+        Bulk manufacturing checks, run once per part after field validation.
+
+        One pass here replaces per-field Python validator callbacks on
+        every nested Hole/Fillet; feature minimums scan a single NumPy
+        array instead of dispatching a callback per object.
+        """
+        dims = self.dimensions
+        min_size, max_size = 10.0, 1000.0
+        if min(dims.length, dims.width, dims.height) < min_size:
             raise ValueError(f"All dimensions must be at least {min_size}mm")
-        
-        max_size = 1000.0
-        if v.length > max_size or v.width > max_size or v.height > max_size:
+        if max(dims.length, dims.width, dims.height) > max_size:
             raise ValueError(f"All dimensions must be at most {max_size}mm")
-        
-        return v
-    
+
+        if self.holes:
+            diameters = np.fromiter(
+                (h.diameter for h in self.holes), dtype=np.float64
+            )
+            if diameters.min() < 1.0:
+                raise ValueError(
+                    "Hole diameter must be at least 1mm for CNC machining"
+                )
+
+        if self.fillets:
+            radii = np.fromiter(
+                (f.radius for f in self.fillets), dtype=np.float64
+            )
+            if radii.min() < 0.5:
+                raise ValueError(
+                    "Fillet radius must be at least 0.5mm for CNC machining"
+                )
+
     def validate_holes_within_bounds(self) -> None:
         """Validate that all holes are within part bounds."""
         for hole in self.holes:
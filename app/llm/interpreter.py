@@ -2,14 +2,30 @@
 LLM-based natural language interpreter.
 Uses LangChain and OpenAI to extract structured intent from text.
 """
+import asyncio
+import functools
+import hashlib
 import os
-from typing import Optional
+import re
+import threading
+from typing import Dict, Optional
 
+from cachetools import LRUCache
 from langchain_openai import ChatOpenAI
 from langchain_core.output_parsers import PydanticOutputParser
-from langchain_core.prompts import PromptTemplate
+from langchain_core.runnables import RunnableLambda
 
-from app.domain.intent import PartIntent
+from app.domain.intent import DimensionIntent, PartIntent
+
+# Fast-path patterns for trivial prompts, compiled once at import. A
+# regex match is orders of magnitude cheaper than an LLM roundtrip, so
+# prompts fully covered by these shapes never reach the network.
+_NUM = r"(\d+(?:\.\d+)?)"
+_CUBE_RE = re.compile(rf"(?:an?\s+)?{_NUM}\s*mm\s+cube", re.IGNORECASE)
+_BOX_RE = re.compile(
+    rf"(?:an?\s+)?{_NUM}\s*x\s*{_NUM}\s*x\s*{_NUM}\s*mm\s+box",
+    re.IGNORECASE,
+)
 
 
 class NaturalLanguageInterpreter:
@@ -76,16 +92,115 @@ If critical information is missing, add it to the missing_information list."""
         
         # Setup output parser
         self.parser = PydanticOutputParser(pydantic_object=PartIntent)
-        
-        # Create prompt template
-        self.prompt = PromptTemplate(
-            template=self.SYSTEM_PROMPT + "\n\nUser description: {text}\n\nExtracted intent:",
-            input_variables=["text"],
-            partial_variables={
-                "format_instructions": self.parser.get_format_instructions()
-            }
+
+        # Precompile the prompt: everything but the user text is fixed,
+        # so rendering becomes one string concat instead of a template
+        # engine pass per request. Substituted via replace because the
+        # format instructions themselves are full of JSON braces.
+        self._prompt_prefix = (
+            self.SYSTEM_PROMPT.replace(
+                "{format_instructions}", self._format_instructions()
+            )
+            + "\n\nUser description: "
         )
-    
+        self._prompt_suffix = "\n\nExtracted intent:"
+
+        # Wire the chain once; rebuilding the RunnableSequence per call
+        # just allocates identical wrapper objects
+        self._chain = (
+            RunnableLambda(self._render_prompt) | self.llm | self.parser
+        )
+
+        # Interpreted intents keyed by normalized prompt digest. A hit
+        # replaces a network-bound LLM call with a dict lookup.
+        self._cache: LRUCache = LRUCache(maxsize=1024)
+        self._cache_lock = threading.RLock()
+        # In-flight async calls by key, so concurrent identical prompts
+        # share one LLM request instead of fanning out duplicates
+        self._inflight: Dict[bytes, asyncio.Future] = {}
+
+    def _render_prompt(self, inputs: dict) -> str:
+        """Render the full prompt for one request with a single concat."""
+        return self._prompt_prefix + inputs["text"] + self._prompt_suffix
+
+    @classmethod
+    @functools.cache
+    def _format_instructions(cls) -> str:
+        """
+        Render the PartIntent format instructions once per process.
+
+        get_format_instructions serializes the full PartIntent JSON
+        schema; the schema never changes, so the rendered string is
+        cached at class level and survives interpreter re-creation
+        (e.g. across tests).
+        """
+        return PydanticOutputParser(
+            pydantic_object=PartIntent
+        ).get_format_instructions()
+
+    @staticmethod
+    def _try_fast_parse(text: str) -> Optional[PartIntent]:
+        """
+        Parse trivial prompts directly, bypassing the LLM.
+
+        Only matches prompts the pattern covers entirely (e.g. "100mm
+        cube", "100x50x30mm box"); anything with extra features falls
+        through to the LLM so no stated detail is silently dropped.
+
+        Args:
+            text: Natural language description of the part
+
+        Returns:
+            PartIntent when the prompt is trivially parseable, else None
+        """
+        stripped = text.strip()
+
+        match = _CUBE_RE.fullmatch(stripped)
+        if match:
+            side = float(match.group(1))
+            return PartIntent(
+                shape="box",
+                dimensions=DimensionIntent(length=side, width=side, height=side),
+            )
+
+        match = _BOX_RE.fullmatch(stripped)
+        if match:
+            length, width, height = (float(g) for g in match.groups())
+            return PartIntent(
+                shape="box",
+                dimensions=DimensionIntent(
+                    length=length, width=width, height=height
+                ),
+            )
+
+        return None
+
+    @staticmethod
+    def _cache_key(text: str) -> bytes:
+        """Digest of the normalized prompt, used as cache key."""
+        return hashlib.blake2b(
+            text.strip().lower().encode(), digest_size=16
+        ).digest()
+
+    def _cached(self, key: bytes) -> Optional[PartIntent]:
+        """Return a deep copy of the cached intent for key, if any."""
+        with self._cache_lock:
+            hit = self._cache.get(key)
+        # Copy so callers can't mutate the cached entry's nested lists
+        return hit.model_copy(deep=True) if hit is not None else None
+
+    def _store(self, key: bytes, intent: PartIntent) -> None:
+        """Cache a successfully parsed intent; parse failures are skipped."""
+        if intent.missing_information and intent.missing_information[0].startswith(
+            "Failed to parse"
+        ):
+            return
+        # Cache a copy: the original is handed to the first caller, who
+        # may mutate its nested lists
+        copy = intent.model_copy(deep=True)
+        with self._cache_lock:
+            self._cache[key] = copy
+
     def interpret(self, text: str) -> PartIntent:
         """
         Interpret natural language text into structured intent.
@@ -96,12 +211,19 @@ If critical information is missing, add it to the missing_information list."""
         Returns:
             PartIntent with extracted parameters
         """
-        # Create the chain
-        chain = self.prompt | self.llm | self.parser
-        
-        # Execute the chain
+        fast = self._try_fast_parse(text)
+        if fast is not None:
+            return fast
+
+        key = self._cache_key(text)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+
+        # Execute the pre-built chain
         try:
-            result = chain.invoke({"text": text})
+            result = self._chain.invoke({"text": text})
+            self._store(key, result)
             return result
         except Exception as e:
             # If parsing fails, return minimal intent with error in missing info
@@ -122,35 +244,72 @@ If critical information is missing, add it to the missing_information list."""
         Returns:
             PartIntent with extracted parameters
         """
-        # Create the chain
-        chain = self.prompt | self.llm | self.parser
-        
-        # Execute the chain asynchronously
+        fast = self._try_fast_parse(text)
+        if fast is not None:
+            return fast
+
+        key = self._cache_key(text)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+
+        # Single-flight: if an identical prompt is already in flight,
+        # await its result instead of issuing a duplicate LLM call
+        loop = asyncio.get_running_loop()
+        with self._cache_lock:
+            pending = self._inflight.get(key)
+            if pending is None:
+                pending = loop.create_future()
+                self._inflight[key] = pending
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            result = await pending
+            return result.model_copy(deep=True)
+
         try:
-            result = await chain.ainvoke({"text": text})
+            # Execute the pre-built chain asynchronously
+            try:
+                result = await self._chain.ainvoke({"text": text})
+                self._store(key, result)
+            except Exception as e:
+                # If parsing fails, return minimal intent with error in missing info
+                result = PartIntent(
+                    missing_information=[
+                        f"Failed to parse description: {str(e)}",
+                        "Please provide a clearer description"
+                    ]
+                )
+            pending.set_result(result)
             return result
-        except Exception as e:
-            # If parsing fails, return minimal intent with error in missing info
-            return PartIntent(
-                missing_information=[
-                    f"Failed to parse description: {str(e)}",
-                    "Please provide a clearer description"
-                ]
-            )
+        finally:
+            with self._cache_lock:
+                self._inflight.pop(key, None)
+            if not pending.done():
+                pending.cancel()
 
 
-# Singleton instance
-_interpreter_instance: Optional[NaturalLanguageInterpreter] = None
+_interpreter: Optional[NaturalLanguageInterpreter] = None
+_interpreter_lock = threading.Lock()
 
 
 def get_interpreter() -> NaturalLanguageInterpreter:
     """
     Get or create the interpreter singleton.
-    
+
+    Double-checked locking so LLM client construction happens exactly
+    once per process even under concurrent first calls; warmed at app
+    startup via the lifespan handler. A failed construction (e.g.
+    missing API key) is not cached and will be retried on the next call.
+
     Returns:
         NaturalLanguageInterpreter instance
     """
-    global _interpreter_instance
-    if _interpreter_instance is None:
-        _interpreter_instance = NaturalLanguageInterpreter()
-    return _interpreter_instance
+    global _interpreter
+    if _interpreter is None:
+        with _interpreter_lock:
+            if _interpreter is None:
+                _interpreter = NaturalLanguageInterpreter()
+    return _interpreter
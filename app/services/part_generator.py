@@ -3,29 +3,103 @@ Part generation service.
 Orchestrates CAD building, validation, and export.
 """
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Tuple
+from typing import Callable, Optional, Tuple
 
 from app.domain.models import CadPart, PartGenerationResult
-from app.cad import CadBuilder
 from app.rules import validate_part, ValidationError
 
 
+# Shared process pool for CPU-bound CAD work. OCCT holds the GIL while
+# building geometry, so a thread pool would still serialize concurrent
+# requests; separate processes let builds run in parallel across cores.
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    Get or create the shared process pool for CAD builds.
+
+    Sized to the core count: builds are compute-bound in the OCCT
+    kernel, so more workers than cores only adds context switching.
+
+    Returns:
+        ProcessPoolExecutor sized to the machine's core count
+    """
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """Shut down the shared process pool (called at app shutdown)."""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown()
+        _process_pool = None
+
+
+# Filename uniqueness: a per-process counter disambiguates requests that
+# land in the same second, and the formatted second is cached so strftime
+# runs at most once per second instead of per request
+_counter = itertools.count()
+_prefix_cache = [0, ""]
+
+
+def _fast_timestamp() -> str:
+    """Return a timestamp tag that is unique within this process."""
+    now = int(time.time())
+    if now != _prefix_cache[0]:
+        _prefix_cache[:] = [
+            now, time.strftime("%Y%m%d_%H%M%S", time.localtime(now))
+        ]
+    return f"{_prefix_cache[1]}_{next(_counter)}"
+
+
+def _build_and_export(part: CadPart, filepath: str) -> None:
+    """
+    Build a part and export it to STEP format.
+
+    Module-level so it can be pickled and executed in a worker process.
+
+    Args:
+        part: CadPart specification
+        filepath: Output STEP file path
+    """
+    from app.cad import CadBuilder
+
+    CadBuilder.create_and_export(part, filepath)
+
+
 class PartGenerationService:
     """Service for generating CAD parts."""
-    
-    def __init__(self, output_dir: str = "output"):
+
+    def __init__(
+        self,
+        output_dir: str = "output",
+        step_writer: Optional[Callable[[CadPart, str], None]] = None
+    ):
         """
         Initialize the part generation service.
-        
+
         Args:
             output_dir: Directory for output STEP files
+            step_writer: Override for the build-and-export step on the
+                sync path, called as step_writer(part, filepath). Lets
+                tests of the orchestration logic skip the OCCT build
+                and STEP serialization; None uses the real CAD builder
         """
+        self._step_writer = step_writer
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        self._executor = ThreadPoolExecutor(max_workers=4)
+        # Resolved once here so per-request path checks avoid the
+        # filesystem round-trips of Path.resolve()
+        self.output_dir_resolved = self.output_dir.resolve()
     
     def _ensure_step_extension(self, filename: str) -> str:
         """
@@ -56,126 +130,178 @@ class PartGenerationService:
             message += f". Warnings: {'; '.join(warnings)}"
         return message
     
-    def generate_part(self, part: CadPart) -> PartGenerationResult:
+    def _generate(
+        self,
+        part: CadPart,
+        filename: Optional[str] = None,
+        skip_validation: bool = False
+    ) -> PartGenerationResult:
         """
-        Generate a STEP file from a CAD part specification.
-        
+        Shared generation path: validate once, build, and export.
+
         Args:
             part: CadPart specification
-            
+            filename: Desired filename, or None for a timestamped one
+            skip_validation: Skip the rules sweep when the caller has
+                already validated this exact part
+
         Returns:
             PartGenerationResult with file path and status
         """
         try:
-            # Validate the part
-            is_valid, errors, warnings = validate_part(part)
-            
-            if not is_valid:
-                error_msg = "Validation failed: " + "; ".join(errors)
-                return PartGenerationResult(
-                    step_file_path="",
-                    status="error",
-                    message=error_msg
-                )
-            
-            # Generate filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"part_{timestamp}.step"
+            warnings = []
+            if not skip_validation:
+                is_valid, errors, warnings = validate_part(part)
+
+                if not is_valid:
+                    error_msg = "Validation failed: " + "; ".join(errors)
+                    return PartGenerationResult.model_construct(
+                        step_file_path="",
+                        status="error",
+                        message=error_msg
+                    )
+
+            if filename is None:
+                filename = f"part_{_fast_timestamp()}.step"
+            else:
+                filename = self._ensure_step_extension(filename)
             filepath = self.output_dir / filename
-            
-            # Build and export CAD model
-            builder = CadBuilder()
-            builder.build_part(part)
-            builder.export_step(str(filepath))
-            
+
+            if self._step_writer is not None:
+                self._step_writer(part, str(filepath))
+            else:
+                # Deferred import: CadQuery takes seconds to load OCCT,
+                # so importing this service stays cheap until a build
+                from app.cad import CadBuilder
+
+                # Build and export CAD model (cached for identical parts)
+                CadBuilder.create_and_export(part, str(filepath))
+
             # Prepare result message
             message = self._build_result_message(warnings)
-            
-            return PartGenerationResult(
+
+            return PartGenerationResult.model_construct(
                 step_file_path=str(filepath),
                 status="success",
                 message=message
             )
-            
+
         except Exception as e:
-            return PartGenerationResult(
+            return PartGenerationResult.model_construct(
                 step_file_path="",
                 status="error",
                 message=f"Error generating part: {str(e)}"
             )
-    
+
+    def generate_part(
+        self,
+        part: CadPart,
+        skip_validation: bool = False
+    ) -> PartGenerationResult:
+        """
+        Generate a STEP file from a CAD part specification.
+
+        Args:
+            part: CadPart specification
+            skip_validation: Skip revalidation for pre-validated parts
+
+        Returns:
+            PartGenerationResult with file path and status
+        """
+        return self._generate(part, skip_validation=skip_validation)
+
     def generate_part_with_name(
         self,
         part: CadPart,
-        filename: str
+        filename: str,
+        skip_validation: bool = False
     ) -> PartGenerationResult:
         """
         Generate a STEP file with a specific filename.
-        
+
         Args:
             part: CadPart specification
             filename: Desired filename (without extension)
-            
+            skip_validation: Skip revalidation for pre-validated parts
+
+        Returns:
+            PartGenerationResult with file path and status
+        """
+        return self._generate(part, filename, skip_validation=skip_validation)
+    
+    async def _generate_async(
+        self,
+        part: CadPart,
+        filename: str
+    ) -> PartGenerationResult:
+        """
+        Validate a part, then build and export it in the process pool.
+
+        Validation is cheap and runs inline; the CPU-intensive OCCT build
+        runs in a worker process so concurrent requests use separate cores.
+
+        Args:
+            part: CadPart specification
+            filename: Output filename (with .step extension)
+
         Returns:
             PartGenerationResult with file path and status
         """
         try:
             # Validate the part
             is_valid, errors, warnings = validate_part(part)
-            
+
             if not is_valid:
                 error_msg = "Validation failed: " + "; ".join(errors)
-                return PartGenerationResult(
+                return PartGenerationResult.model_construct(
                     step_file_path="",
                     status="error",
                     message=error_msg
                 )
-            
-            # Ensure .step extension
-            filename = self._ensure_step_extension(filename)
+
             filepath = self.output_dir / filename
-            
-            # Build and export CAD model
-            builder = CadBuilder()
-            builder.build_part(part)
-            builder.export_step(str(filepath))
-            
+
+            # Build and export CAD model in a worker process
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(
+                get_process_pool(),
+                _build_and_export,
+                part,
+                str(filepath)
+            )
+
             # Prepare result message
             message = self._build_result_message(warnings)
-            
-            return PartGenerationResult(
+
+            return PartGenerationResult.model_construct(
                 step_file_path=str(filepath),
                 status="success",
                 message=message
             )
-            
+
         except Exception as e:
-            return PartGenerationResult(
+            return PartGenerationResult.model_construct(
                 step_file_path="",
                 status="error",
                 message=f"Error generating part: {str(e)}"
             )
-    
+
     async def generate_part_async(self, part: CadPart) -> PartGenerationResult:
         """
         Async version: Generate a STEP file from a CAD part specification.
-        
-        Runs the CPU-intensive CAD operations in a thread pool to avoid
-        blocking the event loop.
-        
+
+        Runs the CPU-intensive CAD operations in a process pool to avoid
+        blocking the event loop and to parallelize across cores.
+
         Args:
             part: CadPart specification
-            
+
         Returns:
             PartGenerationResult with file path and status
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            self._executor,
-            self.generate_part,
-            part
-        )
-    
+        filename = f"part_{_fast_timestamp()}.step"
+        return await self._generate_async(part, filename)
+
     async def generate_part_with_name_async(
         self,
         part: CadPart,
@@ -183,21 +309,16 @@ class PartGenerationService:
     ) -> PartGenerationResult:
         """
         Async version: Generate a STEP file with a specific filename.
-        
-        Runs the CPU-intensive CAD operations in a thread pool to avoid
-        blocking the event loop.
-        
+
+        Runs the CPU-intensive CAD operations in a process pool to avoid
+        blocking the event loop and to parallelize across cores.
+
         Args:
             part: CadPart specification
             filename: Desired filename (without extension)
-            
+
         Returns:
             PartGenerationResult with file path and status
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            self._executor,
-            self.generate_part_with_name,
-            part,
-            filename
-        )
+        filename = self._ensure_step_extension(filename)
+        return await self._generate_async(part, filename)
@@ -0,0 +1,102 @@
+"""
+Shared fixtures for the test suite.
+Keeps expensive CAD setup out of individual tests.
+"""
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from app.cad.generator import CADGenerator
+from app.cad.cadquery_builder import CadQueryBuilder
+from app.domain.intent import PartIntent, DimensionIntent
+
+def assert_step(path_str) -> None:
+    """
+    Assert that a path names a non-empty regular STEP file.
+
+    One os.stat call replaces the exists/size/suffix assertion trios,
+    which each re-stat the file.
+
+    Args:
+        path_str: Path to the expected STEP file (str or Path)
+    """
+    st = os.stat(path_str)
+    assert stat.S_ISREG(st.st_mode)
+    assert st.st_size > 0
+    assert str(path_str).endswith(".step")
+
+
+# The canonical smoke-test part used across test modules
+REFERENCE_PART = PartIntent(
+    shape="box",
+    dimensions=DimensionIntent(length=100.0, width=50.0, height=30.0)
+)
+
+
+def pytest_configure(config):
+    """
+    Point tmp_path at tmpfs when PYTEST_FAST=1.
+
+    STEP exports are bytes-heavy synchronous writes; on CI runners with
+    slow disks, backing pytest's temp root with /dev/shm makes them
+    memory-bound. Opt-in so an explicit --basetemp and non-Linux
+    platforms are left alone.
+    """
+    if (
+        os.environ.get("PYTEST_FAST") == "1"
+        and config.option.basetemp is None
+        and Path("/dev/shm").is_dir()
+    ):
+        config.option.basetemp = f"/dev/shm/pytest-{os.getuid()}"
+
+
+def pytest_sessionstart(session):
+    """
+    Prime OCCT before any test runs.
+
+    Loading CadQuery's shared libraries and building the first
+    primitive dominates whichever test happens to run first; warming
+    here keeps that cold-start cost out of individual test timings.
+    """
+    from app.cad import warmup
+
+    warmup()
+
+
+@pytest.fixture(scope="session")
+def cq_builder():
+    """One CadQueryBuilder shared by every test in the session."""
+    return CadQueryBuilder()
+
+
+@pytest.fixture(scope="session")
+def _shared_generator(tmp_path_factory):
+    """Session-wide CADGenerator; tests repoint its output directory."""
+    return CADGenerator(output_dir=str(tmp_path_factory.mktemp("cad")))
+
+
+@pytest.fixture(scope="session")
+def reference_box_step(cq_builder, tmp_path_factory):
+    """
+    The reference STEP export of REFERENCE_PART, built once per session.
+
+    Smoke tests that re-generate this exact part compare against these
+    bytes instead of asserting mere existence; building it first also
+    primes the content-addressed STEP cache, so their builds are cache
+    hits rather than fresh OCCT exports.
+    """
+    return cq_builder.build(REFERENCE_PART, tmp_path_factory.mktemp("ref"))
+
+
+@pytest.fixture
+def generator(_shared_generator, tmp_path):
+    """
+    The shared CADGenerator aimed at this test's tmp_path.
+
+    Reuses the session instance (and its cached engine builders) while
+    keeping output files isolated per test.
+    """
+    _shared_generator.output_dir = tmp_path
+    return _shared_generator
@@ -5,9 +5,22 @@ import pytest
 import asyncio
 from httpx import AsyncClient, ASGITransport
 from app.main import app
+from app.domain.intent import DimensionIntent, PartIntent
 from app.domain.models import CadPart, Dimensions
 
 
+class _StubInterpreter:
+    """Interpreter stand-in: no LLM, fails on request for one prompt."""
+
+    async def interpret_async(self, text: str) -> PartIntent:
+        if "unparseable" in text:
+            raise RuntimeError("LLM unavailable")
+        return PartIntent(
+            shape="box",
+            dimensions=DimensionIntent(length=10, width=10, height=10),
+        )
+
+
 @pytest.mark.asyncio
 async def test_concurrent_part_generation():
     """Test that multiple parts can be generated concurrently."""
@@ -41,6 +54,91 @@ async def test_concurrent_part_generation():
             print(f"Request {i+1} completed: {result['step_file_path']}")
 
 
+@pytest.mark.asyncio
+async def test_parts_batch_streams_ndjson():
+    """Test batch generation: one result line per part, errors included."""
+    import json
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/parts/batch",
+            json=[
+                {
+                    "shape": "box",
+                    "dimensions": {"length": 60, "width": 40, "height": 20},
+                    "holes": [],
+                    "fillets": []
+                },
+                {
+                    # Holes too close together fail validation
+                    "shape": "box",
+                    "dimensions": {"length": 50, "width": 50, "height": 25},
+                    "holes": [
+                        {
+                            "diameter": 15,
+                            "depth": 20,
+                            "position": {"x": 0, "y": 0, "z": 0}
+                        },
+                        {
+                            "diameter": 15,
+                            "depth": 20,
+                            "position": {"x": 5, "y": 0, "z": 0}
+                        }
+                    ],
+                    "fillets": []
+                },
+            ]
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+
+        results = [
+            json.loads(line) for line in response.text.splitlines() if line
+        ]
+        assert len(results) == 2
+
+        # Lines arrive in completion order, so match results by status
+        by_status = {result["status"]: result for result in results}
+        assert by_status["success"]["step_file_path"] != ""
+        assert "too close" in by_status["error"]["message"].lower()
+
+
+@pytest.mark.asyncio
+async def test_interpret_batch(monkeypatch):
+    """Test batch interpretation: per-item errors don't fail the batch."""
+    from app.api.v1 import interpret as interpret_module
+
+    monkeypatch.setattr(
+        interpret_module, "get_interpreter", lambda: _StubInterpreter()
+    )
+    interpret_module._intent_cache.clear()
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/interpret/batch",
+            json=[
+                {"text": "a 10mm plate with one hole"},
+                {"text": "an unparseable description"},
+            ]
+        )
+
+        assert response.status_code == 200
+        results = response.json()
+        assert len(results) == 2
+
+        # Results come back in input order
+        assert results[0]["intent"]["shape"] == "box"
+        assert results[0]["intent"]["dimensions"]["length"] == 10
+
+        # The failed item is converted into an error intent
+        assert results[1]["intent"]["missing_information"][0].startswith(
+            "Interpretation failed"
+        )
+
+
 @pytest.mark.asyncio
 async def test_health_endpoints_async():
     """Test health check endpoints are async."""
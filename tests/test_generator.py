@@ -2,19 +2,24 @@
 Tests for CAD generator module.
 Tests the generic CAD generator and its builder classes.
 """
-import pytest
+import sys
+import types
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import Mock, MagicMock
+
+import pytest
 from app.cad.generator import CADGenerator
 from app.cad.cadquery_builder import CadQueryBuilder
 from app.cad.solidworks_builder import SolidWorksBuilder
 from app.domain.intent import PartIntent, DimensionIntent, HoleIntent, FilletIntent
+from tests.conftest import REFERENCE_PART, assert_step
 
 
 def test_generator_initialization(tmp_path):
     """Test CADGenerator initialization."""
     generator = CADGenerator(output_dir=str(tmp_path))
-    
+
     assert generator.output_dir == tmp_path
     assert generator.output_dir.exists()
 
@@ -28,228 +33,184 @@ def test_generator_initialization_creates_directory(tmp_path):
     assert test_dir.is_dir()
 
 
-def test_generate_cadquery_simple_box(tmp_path):
-    """Test generating a simple box with CadQuery engine."""
-    generator = CADGenerator(output_dir=str(tmp_path))
-    
-    part = PartIntent(
-        shape="box",
-        dimensions=DimensionIntent(length=100.0, width=50.0, height=30.0)
-    )
-    
+# The CadQuery build path exercised over one parameter axis: base box,
+# box + hole, box + fillets, and a part combining both feature types
+CADQUERY_CASES = [
+    (
+        "simple_box",
+        PartIntent(
+            shape="box",
+            dimensions=DimensionIntent(length=100.0, width=50.0, height=30.0)
+        ),
+    ),
+    (
+        "with_hole",
+        PartIntent(
+            shape="box",
+            dimensions=DimensionIntent(length=100.0, width=100.0, height=50.0),
+            holes=[
+                HoleIntent(diameter=20.0, depth=30.0, location="center")
+            ]
+        ),
+    ),
+    (
+        "with_fillets",
+        PartIntent(
+            shape="box",
+            dimensions=DimensionIntent(length=100.0, width=50.0, height=30.0),
+            fillets=[
+                FilletIntent(radius=5.0, location="all edges")
+            ]
+        ),
+    ),
+    (
+        "complex_part",
+        PartIntent(
+            shape="box",
+            dimensions=DimensionIntent(length=150.0, width=100.0, height=50.0),
+            holes=[
+                HoleIntent(diameter=10.0, depth=25.0, location="center"),
+                HoleIntent(diameter=15.0, depth=30.0, location="center")
+            ],
+            fillets=[
+                FilletIntent(radius=3.0, location="top"),
+                FilletIntent(radius=2.0, location="all edges")
+            ]
+        ),
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "part", [c[1] for c in CADQUERY_CASES], ids=[c[0] for c in CADQUERY_CASES]
+)
+def test_generate_cadquery(generator, part):
+    """Test generating parts with the CadQuery engine."""
     result = generator.generate(part, engine="cadquery")
-    
-    assert result["status"] == "ok"
-    assert result["file_path"] != ""
-    assert Path(result["file_path"]).exists()
-    assert result["file_path"].endswith(".step")
-    assert result["errors"] == []
-
 
-def test_generate_cadquery_with_hole(tmp_path):
-    """Test generating a box with hole using CadQuery engine."""
-    generator = CADGenerator(output_dir=str(tmp_path))
-    
-    part = PartIntent(
-        shape="box",
-        dimensions=DimensionIntent(length=100.0, width=100.0, height=50.0),
-        holes=[
-            HoleIntent(diameter=20.0, depth=30.0, location="center")
-        ]
-    )
-    
-    result = generator.generate(part, engine="cadquery")
-    
     assert result["status"] == "ok"
-    assert Path(result["file_path"]).exists()
+    assert_step(result["file_path"])
     assert result["errors"] == []
 
 
-def test_generate_cadquery_with_fillets(tmp_path):
-    """Test generating a box with fillets using CadQuery engine."""
-    generator = CADGenerator(output_dir=str(tmp_path))
-    
-    part = PartIntent(
-        shape="box",
-        dimensions=DimensionIntent(length=100.0, width=50.0, height=30.0),
-        fillets=[
-            FilletIntent(radius=5.0, location="all edges")
-        ]
-    )
-    
-    result = generator.generate(part, engine="cadquery")
-    
-    assert result["status"] == "ok"
-    assert Path(result["file_path"]).exists()
-    assert result["errors"] == []
+# Error-path cases: (id, part, engine, expected error substring)
+ERROR_CASES = [
+    (
+        "unsupported_engine",
+        PartIntent(
+            shape="box",
+            dimensions=DimensionIntent(length=100.0, width=50.0, height=30.0)
+        ),
+        "invalid_engine",
+        "Unsupported engine",
+    ),
+    (
+        "engine_typo",
+        PartIntent(
+            shape="box",
+            dimensions=DimensionIntent(length=100.0, width=50.0, height=30.0)
+        ),
+        "cadquery_typo",
+        "Unsupported engine",
+    ),
+    (
+        "missing_dimensions",
+        PartIntent(shape="box", dimensions=None),
+        "cadquery",
+        "",
+    ),
+    (
+        "missing_shape",
+        PartIntent(
+            shape=None,
+            dimensions=DimensionIntent(length=100.0, width=50.0, height=30.0)
+        ),
+        "cadquery",
+        "",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "part,engine,substr",
+    [c[1:] for c in ERROR_CASES],
+    ids=[c[0] for c in ERROR_CASES],
+)
+def test_generate_error_paths(generator, part, engine, substr):
+    """Test that invalid inputs surface as error results."""
+    result = generator.generate(part, engine=engine)
 
-
-def test_generate_cadquery_complex_part(tmp_path):
-    """Test generating a complex part with holes and fillets."""
-    generator = CADGenerator(output_dir=str(tmp_path))
-    
-    part = PartIntent(
-        shape="box",
-        dimensions=DimensionIntent(length=150.0, width=100.0, height=50.0),
-        holes=[
-            HoleIntent(diameter=10.0, depth=25.0, location="center"),
-            HoleIntent(diameter=15.0, depth=30.0, location="center")
-        ],
-        fillets=[
-            FilletIntent(radius=3.0, location="top"),
-            FilletIntent(radius=2.0, location="all edges")
-        ]
-    )
-    
-    result = generator.generate(part, engine="cadquery")
-    
-    assert result["status"] == "ok"
-    assert Path(result["file_path"]).exists()
-    assert result["errors"] == []
-
-
-def test_generate_unsupported_engine(tmp_path):
-    """Test that unsupported engine returns error."""
-    generator = CADGenerator(output_dir=str(tmp_path))
-    
-    part = PartIntent(
-        shape="box",
-        dimensions=DimensionIntent(length=100.0, width=50.0, height=30.0)
-    )
-    
-    result = generator.generate(part, engine="invalid_engine")
-    
-    assert result["status"] == "error"
-    assert result["file_path"] == ""
-    assert len(result["errors"]) > 0
-    assert "Unsupported engine" in result["errors"][0]
-
-
-def test_generate_missing_dimensions(tmp_path):
-    """Test that missing dimensions returns error."""
-    generator = CADGenerator(output_dir=str(tmp_path))
-    
-    part = PartIntent(
-        shape="box",
-        dimensions=None
-    )
-    
-    result = generator.generate(part, engine="cadquery")
-    
-    assert result["status"] == "error"
-    assert result["file_path"] == ""
-    assert len(result["errors"]) > 0
-
-
-def test_generate_missing_shape(tmp_path):
-    """Test that missing shape returns error."""
-    generator = CADGenerator(output_dir=str(tmp_path))
-    
-    part = PartIntent(
-        shape=None,
-        dimensions=DimensionIntent(length=100.0, width=50.0, height=30.0)
-    )
-    
-    result = generator.generate(part, engine="cadquery")
-    
     assert result["status"] == "error"
     assert result["file_path"] == ""
     assert len(result["errors"]) > 0
-
-
-def test_cadquery_builder_class(tmp_path):
+    if substr:
+        assert substr in result["errors"][0]
+
+
+BUILDER_CASES = [
+    (
+        "plain",
+        PartIntent(
+            shape="box",
+            dimensions=DimensionIntent(length=80.0, width=60.0, height=40.0)
+        ),
+    ),
+    (
+        "with_features",
+        PartIntent(
+            shape="box",
+            dimensions=DimensionIntent(length=100.0, width=100.0, height=50.0),
+            holes=[
+                HoleIntent(diameter=20.0, depth=30.0, location="center")
+            ],
+            fillets=[
+                FilletIntent(radius=5.0, location="all edges")
+            ]
+        ),
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "part", [c[1] for c in BUILDER_CASES], ids=[c[0] for c in BUILDER_CASES]
+)
+def test_cadquery_builder_class(cq_builder, tmp_path, part):
     """Test the CadQueryBuilder class directly."""
-    builder = CadQueryBuilder()
-    
-    part = PartIntent(
-        shape="box",
-        dimensions=DimensionIntent(length=80.0, width=60.0, height=40.0)
-    )
-    
-    filepath = builder.build(part, tmp_path)
-    
-    assert filepath.exists()
-    assert filepath.suffix == ".step"
-    assert filepath.parent == tmp_path
-
+    filepath = cq_builder.build(part, tmp_path)
 
-def test_cadquery_builder_with_features(tmp_path):
-    """Test CadQueryBuilder with holes and fillets."""
-    builder = CadQueryBuilder()
-    
-    part = PartIntent(
-        shape="box",
-        dimensions=DimensionIntent(length=100.0, width=100.0, height=50.0),
-        holes=[
-            HoleIntent(diameter=20.0, depth=30.0, location="center")
-        ],
-        fillets=[
-            FilletIntent(radius=5.0, location="all edges")
-        ]
-    )
-    
-    filepath = builder.build(part, tmp_path)
-    
-    assert filepath.exists()
-    assert filepath.stat().st_size > 0
-
-
-def test_build_step_invalid_shape(tmp_path):
-    """Test that unsupported shape raises error."""
-    # Note: PartIntent schema only accepts "box" currently via Literal type
-    # This test validates the error handling at the generation level
-    # We'll test using the generator with an unsupported engine instead
-    from app.cad.generator import CADGenerator
-    
-    generator = CADGenerator(output_dir=str(tmp_path))
-    part = PartIntent(
-        shape="box",
-        dimensions=DimensionIntent(length=100.0, width=50.0, height=30.0)
-    )
-    
-    # Test with a typo in engine name
-    result = generator.generate(part, engine="cadquery_typo")
-    
-    assert result["status"] == "error"
-    assert "Unsupported engine" in result["errors"][0]
+    assert_step(filepath)
+    assert filepath.parent == tmp_path
 
 
-def test_cadquery_builder_missing_dimensions(tmp_path):
+def test_cadquery_builder_missing_dimensions(cq_builder, tmp_path):
     """Test that missing dimensions raises error."""
-    builder = CadQueryBuilder()
-    
     part = PartIntent(
         shape="box",
         dimensions=None
     )
     
     with pytest.raises(ValueError):
-        builder.build(part, tmp_path)
+        cq_builder.build(part, tmp_path)
 
 
-def test_multiple_files_unique_names(tmp_path):
+def test_multiple_files_unique_names(generator, reference_box_step):
     """Test that multiple generated files have unique names."""
-    generator = CADGenerator(output_dir=str(tmp_path))
-    
-    part = PartIntent(
-        shape="box",
-        dimensions=DimensionIntent(length=100.0, width=50.0, height=30.0)
-    )
-    
-    result1 = generator.generate(part, engine="cadquery")
-    result2 = generator.generate(part, engine="cadquery")
-    
+    result1 = generator.generate(REFERENCE_PART, engine="cadquery")
+    result2 = generator.generate(REFERENCE_PART, engine="cadquery")
+
     assert result1["status"] == "ok"
     assert result2["status"] == "ok"
     assert result1["file_path"] != result2["file_path"]
-    assert Path(result1["file_path"]).exists()
-    assert Path(result2["file_path"]).exists()
 
+    # Identical parts must serve identical STEP contents; both builds
+    # are cache hits against the session reference export
+    reference_bytes = reference_box_step.read_bytes()
+    assert Path(result1["file_path"]).read_bytes() == reference_bytes
+    assert Path(result2["file_path"]).read_bytes() == reference_bytes
 
-def test_solidworks_engine_without_pywin32(tmp_path):
+
+def test_solidworks_engine_without_pywin32(generator):
     """Test that SolidWorks engine without pywin32 returns helpful error."""
-    generator = CADGenerator(output_dir=str(tmp_path))
-    
     part = PartIntent(
         shape="box",
         dimensions=DimensionIntent(length=100.0, width=50.0, height=30.0)
@@ -272,10 +233,8 @@ def test_generator_default_output_dir():
     assert generator.output_dir.exists()
 
 
-def test_cadquery_builder_partial_hole_data(tmp_path):
+def test_cadquery_builder_partial_hole_data(cq_builder, tmp_path):
     """Test that holes without complete data are skipped gracefully."""
-    builder = CadQueryBuilder()
-    
     part = PartIntent(
         shape="box",
         dimensions=DimensionIntent(length=100.0, width=50.0, height=30.0),
@@ -285,16 +244,15 @@ def test_cadquery_builder_partial_hole_data(tmp_path):
         ]
     )
     
-    # Should complete without error, skipping invalid holes
-    filepath = builder.build(part, tmp_path)
-    
-    assert filepath.exists()
+    # Should complete without error, skipping invalid holes; geometry
+    # validity is the point here, so skip the STEP serialization
+    filepath = cq_builder.build(part, tmp_path, export=False)
 
+    assert filepath.suffix == ".step"
 
-def test_cadquery_builder_partial_fillet_data(tmp_path):
+
+def test_cadquery_builder_partial_fillet_data(cq_builder, tmp_path):
     """Test that fillets without radius are skipped gracefully."""
-    builder = CadQueryBuilder()
-    
     part = PartIntent(
         shape="box",
         dimensions=DimensionIntent(length=100.0, width=50.0, height=30.0),
@@ -303,10 +261,11 @@ def test_cadquery_builder_partial_fillet_data(tmp_path):
         ]
     )
     
-    # Should complete without error, skipping invalid fillets
-    filepath = builder.build(part, tmp_path)
-    
-    assert filepath.exists()
+    # Should complete without error, skipping invalid fillets; geometry
+    # validity is the point here, so skip the STEP serialization
+    filepath = cq_builder.build(part, tmp_path, export=False)
+
+    assert filepath.suffix == ".step"
 
 
 # ============================================================================
@@ -314,80 +273,130 @@ def test_cadquery_builder_partial_fillet_data(tmp_path):
 # ============================================================================
 
 @pytest.fixture
-def mock_solidworks_modules():
-    """Fixture to mock win32com and pythoncom modules."""
-    with patch.dict('sys.modules', {
-        'win32com': MagicMock(),
-        'win32com.client': MagicMock(),
-        'pythoncom': MagicMock()
-    }):
-        import sys
-        # Setup the mocked modules to be returned properly
-        yield sys.modules
-
+def mock_solidworks_modules(monkeypatch):
+    """
+    Install win32com/pythoncom stand-ins and yield the wired mock graph.
+
+    win32com itself is a plain module stub (nothing records calls on
+    it); its client tree and pythoncom stay MagicMocks because the
+    builder and the tests rely on call recording for dispatch and COM
+    initialization. The yielded namespace carries the app/model/
+    extension/dispatch mocks from make_sw_mocks plus the patched
+    sys.modules, so tests only override the behavior they exercise.
+    """
+    win32com_stub = types.ModuleType("win32com")
+    win32com_stub.client = MagicMock()
+    monkeypatch.setitem(sys.modules, 'win32com', win32com_stub)
+    monkeypatch.setitem(sys.modules, 'win32com.client', win32com_stub.client)
+    monkeypatch.setitem(sys.modules, 'pythoncom', MagicMock())
+
+    import app.cad.solidworks_builder as sw_builder
+    # Reset the cached COM proxy so each test binds its own mock
+    sw_builder._sw_app = None
+    sw = make_sw_mocks(sys.modules)
+    sw.modules = sys.modules
+    yield sw
+    sw_builder._sw_app = None
+
+
+# Attribute surfaces of the COM proxies the builder touches. Used as
+# spec_set so mock attribute access stays cheap and typos in either the
+# builder or the tests fail loudly instead of recording silently.
+class _SwAppSpec:
+    Visible = None
+    UserControl = None
+    CommandInProgress = None
+
+    def NewDocument(self): ...
+    def GetUserPreferenceStringValue(self): ...
+    def RunMacro2(self): ...
+    def CloseDoc(self): ...
+    def ExitApp(self): ...
+
+
+class _SwModelSpec:
+    Extension = None
+    FeatureManager = None
+
+    def GetTitle(self): ...
+    def SaveAs3(self): ...
+    def EditRebuild3(self): ...
+
+
+class _SwExtensionSpec:
+    def SelectByID2(self): ...
+
+
+def make_sw_mocks(sys_modules):
+    """
+    Build the standard SolidWorks COM mock graph.
+
+    Wires app -> model -> extension with the responses every mocked
+    test needs (successful document creation, selection, and save), so
+    individual tests only override what they specifically exercise.
+
+    Args:
+        sys_modules: The patched sys.modules from mock_solidworks_modules
+
+    Returns:
+        SimpleNamespace with app, model, extension, and dispatch mocks
+    """
+    mock_app = MagicMock(spec_set=_SwAppSpec)
+    mock_model = MagicMock(spec_set=_SwModelSpec)
+    mock_extension = MagicMock(spec_set=_SwExtensionSpec)
 
-def test_solidworks_builder_simple_box_mocked(tmp_path, mock_solidworks_modules):
-    """Test SolidWorks builder with mocked COM API (runs on macOS)."""
-    import sys
-    
-    # Setup mock behavior
-    mock_app = MagicMock()
-    mock_model = MagicMock()
-    mock_extension = MagicMock()
-    
-    # Configure the Dispatch mock to return our mock app
     mock_dispatch = Mock(return_value=mock_app)
-    sys.modules['win32com'].client = MagicMock()
-    sys.modules['win32com'].client.Dispatch = mock_dispatch
-    
+    sys_modules['win32com'].client = MagicMock()
+    sys_modules['win32com'].client.gencache.EnsureDispatch = mock_dispatch
+
     mock_app.NewDocument.return_value = mock_model
     mock_app.GetUserPreferenceStringValue.return_value = "default_template"
     mock_model.Extension = mock_extension
     mock_extension.SelectByID2.return_value = True
     mock_model.GetTitle.return_value = "MockPart"
-    mock_model.SaveAs.return_value = True
-    
+    mock_model.SaveAs3.return_value = True
+
+    return SimpleNamespace(
+        app=mock_app,
+        model=mock_model,
+        extension=mock_extension,
+        dispatch=mock_dispatch,
+    )
+
+
+@pytest.mark.serial
+@pytest.mark.forked
+def test_solidworks_builder_simple_box_mocked(tmp_path, mock_solidworks_modules):
+    """Test SolidWorks builder with mocked COM API (runs on macOS)."""
+    sw = mock_solidworks_modules
+
     # Create builder and part
     builder = SolidWorksBuilder()
     part = PartIntent(
         shape="box",
         dimensions=DimensionIntent(length=100.0, width=50.0, height=30.0)
     )
-    
+
     # Build the part
     filepath = builder.build(part, tmp_path)
-    
+
     # Verify mocks were called
-    sys.modules['pythoncom'].CoInitialize.assert_called()
-    mock_dispatch.assert_called_with("SldWorks.Application")
-    mock_app.NewDocument.assert_called()
-    
+    sw.modules['pythoncom'].CoInitializeEx.assert_called()
+    sw.dispatch.assert_called_with("SldWorks.Application")
+    sw.app.NewDocument.assert_called()
+
     # Verify file path
     assert filepath.parent == tmp_path
     assert filepath.suffix == ".sldprt"
     assert "part_" in filepath.name
 
 
+@pytest.mark.serial
+@pytest.mark.forked
 def test_solidworks_builder_with_features_mocked(tmp_path, mock_solidworks_modules):
     """Test SolidWorks builder with holes and fillets (mocked, runs on macOS)."""
-    import sys
-    
-    # Setup mock behavior
-    mock_app = MagicMock()
-    mock_model = MagicMock()
-    mock_extension = MagicMock()
-    
-    mock_dispatch = Mock(return_value=mock_app)
-    sys.modules['win32com'].client = MagicMock()
-    sys.modules['win32com'].client.Dispatch = mock_dispatch
-    
-    mock_app.NewDocument.return_value = mock_model
-    mock_app.GetUserPreferenceStringValue.return_value = "default_template"
-    mock_model.Extension = mock_extension
-    mock_extension.SelectByID2.return_value = True
-    mock_model.GetTitle.return_value = "MockPart"
-    mock_model.SaveAs.return_value = True
-    
+    sw = mock_solidworks_modules
+
     # Create builder and part with features
     builder = SolidWorksBuilder()
     part = PartIntent(
@@ -403,10 +412,10 @@ def test_solidworks_builder_with_features_mocked(tmp_path, mock_solidworks_modul
     
     # Build the part
     filepath = builder.build(part, tmp_path)
-    
-    # Verify the builder called methods for holes and fillets
-    # InsertSketch2 should be called for sketch operations
-    assert mock_model.InsertSketch2.called
+
+    # Verify the geometry macro was executed (all sketch/feature
+    # operations run inside SolidWorks via a single RunMacro2 call)
+    assert sw.app.RunMacro2.called
     
     # Verify file creation
     assert filepath.suffix == ".sldprt"
@@ -435,28 +444,11 @@ def test_solidworks_builder_validation_mocked():
         builder.validate(part)
 
 
-def test_solidworks_via_generator_mocked(tmp_path, mock_solidworks_modules):
+@pytest.mark.serial
+@pytest.mark.forked
+def test_solidworks_via_generator_mocked(generator, mock_solidworks_modules):
     """Test SolidWorks engine via CADGenerator (mocked, runs on macOS)."""
-    import sys
-    
-    # Setup mock behavior
-    mock_app = MagicMock()
-    mock_model = MagicMock()
-    mock_extension = MagicMock()
-    
-    mock_dispatch = Mock(return_value=mock_app)
-    sys.modules['win32com'].client = MagicMock()
-    sys.modules['win32com'].client.Dispatch = mock_dispatch
-    
-    mock_app.NewDocument.return_value = mock_model
-    mock_app.GetUserPreferenceStringValue.return_value = "default_template"
-    mock_model.Extension = mock_extension
-    mock_extension.SelectByID2.return_value = True
-    mock_model.GetTitle.return_value = "MockPart"
-    mock_model.SaveAs.return_value = True
-    
     # Create generator and part
-    generator = CADGenerator(output_dir=str(tmp_path))
     part = PartIntent(
         shape="box",
         dimensions=DimensionIntent(length=100.0, width=50.0, height=30.0)
@@ -472,26 +464,13 @@ def test_solidworks_via_generator_mocked(tmp_path, mock_solidworks_modules):
     assert result["errors"] == []
 
 
+@pytest.mark.serial
+@pytest.mark.forked
 def test_solidworks_builder_save_failure_mocked(tmp_path, mock_solidworks_modules):
     """Test SolidWorks builder handles save failures (mocked, runs on macOS)."""
-    import sys
-    
-    # Setup mock behavior with save failure
-    mock_app = MagicMock()
-    mock_model = MagicMock()
-    mock_extension = MagicMock()
-    
-    mock_dispatch = Mock(return_value=mock_app)
-    sys.modules['win32com'].client = MagicMock()
-    sys.modules['win32com'].client.Dispatch = mock_dispatch
-    
-    mock_app.NewDocument.return_value = mock_model
-    mock_app.GetUserPreferenceStringValue.return_value = "default_template"
-    mock_model.Extension = mock_extension
-    mock_extension.SelectByID2.return_value = True
-    mock_model.GetTitle.return_value = "MockPart"
-    mock_model.SaveAs.return_value = False  # Simulate save failure
-    
+    sw = mock_solidworks_modules
+    sw.model.SaveAs3.return_value = False  # Simulate save failure
+
     # Create builder and part
     builder = SolidWorksBuilder()
     part = PartIntent(
@@ -504,25 +483,15 @@ def test_solidworks_builder_save_failure_mocked(tmp_path, mock_solidworks_module
         builder.build(part, tmp_path)
 
 
+@pytest.mark.serial
+@pytest.mark.forked
 def test_solidworks_builder_cleanup_on_error_mocked(tmp_path, mock_solidworks_modules):
     """Test SolidWorks builder cleanup on error (mocked, runs on macOS)."""
-    import sys
-    
-    # Setup mock behavior with error during creation
-    mock_app = MagicMock()
-    mock_model = MagicMock()
-    
-    mock_dispatch = Mock(return_value=mock_app)
-    sys.modules['win32com'].client = MagicMock()
-    sys.modules['win32com'].client.Dispatch = mock_dispatch
-    
-    mock_app.NewDocument.return_value = mock_model
-    mock_app.GetUserPreferenceStringValue.return_value = "default_template"
-    mock_model.GetTitle.return_value = "MockPart"
-    
-    # Simulate error during model creation
-    mock_model.Extension.SelectByID2.side_effect = Exception("Mock error")
-    
+    sw = mock_solidworks_modules
+
+    # Simulate error during geometry macro execution
+    sw.app.RunMacro2.side_effect = Exception("Mock error")
+
     # Create builder and part
     builder = SolidWorksBuilder()
     part = PartIntent(
@@ -534,5 +503,6 @@ def test_solidworks_builder_cleanup_on_error_mocked(tmp_path, mock_solidworks_mo
     with pytest.raises(RuntimeError, match="Failed to build SLDPRT file"):
         builder.build(part, tmp_path)
     
-    # Verify cleanup was attempted
-    sys.modules['pythoncom'].CoUninitialize.assert_called()
+    # Verify cleanup was attempted: the document is closed but the app
+    # proxy stays alive for the next build
+    assert sw.app.CloseDoc.called
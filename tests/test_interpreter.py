@@ -0,0 +1,45 @@
+"""
+Tests for the natural language interpreter's caching behavior.
+"""
+from unittest.mock import Mock
+
+import pytest
+
+from app.domain.intent import DimensionIntent, PartIntent
+from app.llm.interpreter import NaturalLanguageInterpreter
+
+
+@pytest.fixture
+def interpreter():
+    """Interpreter with the LLM chain stubbed out (no network)."""
+    interp = NaturalLanguageInterpreter(api_key="test-key")
+    interp._chain = Mock()
+    interp._chain.invoke.return_value = PartIntent(
+        shape="box",
+        dimensions=DimensionIntent(length=80, width=40, height=20),
+        missing_information=["Hole positions not specified"],
+    )
+    return interp
+
+
+def test_interpret_caches_llm_results(interpreter):
+    """A repeated prompt is served from cache without a second LLM call."""
+    # Not covered by the regex fast-path, so it must go through the chain
+    text = "an 80x40x20mm plate with two mounting holes"
+
+    first = interpreter.interpret(text)
+    second = interpreter.interpret(text)
+
+    assert interpreter._chain.invoke.call_count == 1
+    assert second == first
+
+
+def test_interpret_cache_returns_independent_copies(interpreter):
+    """Mutating a cached result must not corrupt later cache hits."""
+    text = "an 80x40x20mm plate with two mounting holes"
+
+    first = interpreter.interpret(text)
+    first.missing_information.append("mutated by caller")
+
+    second = interpreter.interpret(text)
+    assert second.missing_information == ["Hole positions not specified"]
@@ -7,26 +7,93 @@ from app.services.part_generator import PartGenerationService
 from app.domain.models import CadPart, Dimensions, Hole, Fillet, Position
 
 
-def test_generate_simple_part(tmp_path):
-    """Test generating a simple part."""
-    service = PartGenerationService(output_dir=str(tmp_path))
-    
-    part = CadPart(
-        shape="box",
-        dimensions=Dimensions(length=100, width=50, height=30)
+def _touch_writer(part, filepath):
+    """Stand-in STEP writer: creates the file without building geometry."""
+    Path(filepath).touch()
+
+
+@pytest.fixture(scope="module")
+def service(tmp_path_factory):
+    """
+    Shared service with the STEP write stubbed out.
+
+    These tests exercise validation and result handling; the OCCT build
+    and STEP serialization are covered by test_generate_part_exports.
+    """
+    return PartGenerationService(
+        output_dir=str(tmp_path_factory.mktemp("parts")),
+        step_writer=_touch_writer,
     )
-    
+
+
+@pytest.fixture(scope="module")
+def exporting_service(tmp_path_factory):
+    """Shared service running the real CAD build and STEP export."""
+    return PartGenerationService(
+        output_dir=str(tmp_path_factory.mktemp("parts_export"))
+    )
+
+
+# Generate-and-assert cases: (id, part, expected status, message substring)
+CASES = [
+    (
+        "simple_box",
+        CadPart(
+            shape="box",
+            dimensions=Dimensions(length=100, width=50, height=30)
+        ),
+        "success",
+        None,
+    ),
+    (
+        "invalid_close_holes",
+        # Holes too close together fail validation
+        CadPart(
+            shape="box",
+            dimensions=Dimensions(length=50, width=50, height=25),
+            holes=[
+                Hole(diameter=15, depth=20, position=Position(x=0, y=0, z=0)),
+                Hole(diameter=15, depth=20, position=Position(x=5, y=0, z=0))
+            ]
+        ),
+        "error",
+        "too close",
+    ),
+    (
+        "deep_hole_warning",
+        # Depth/diameter = 60/5 = 12 exceeds MAX_HOLE_DEPTH_RATIO of 10
+        CadPart(
+            shape="box",
+            dimensions=Dimensions(length=100, width=100, height=70),
+            holes=[
+                Hole(diameter=5, depth=60, position=Position(x=0, y=0, z=0))
+            ]
+        ),
+        "success",
+        "warning",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "part,expected_status,substring",
+    [c[1:] for c in CASES],
+    ids=[c[0] for c in CASES],
+)
+def test_generate_part(service, part, expected_status, substring):
+    """Test generate_part across success, error, and warning cases."""
     result = service.generate_part(part)
-    
-    assert result.status == "success"
-    assert result.step_file_path != ""
-    assert Path(result.step_file_path).exists()
 
+    assert result.status == expected_status
+    if expected_status == "success":
+        assert result.step_file_path != ""
+        assert Path(result.step_file_path).exists()
+    if substring:
+        assert substring in result.message.lower()
 
-def test_generate_part_with_features(tmp_path):
-    """Test generating a part with holes and fillets."""
-    service = PartGenerationService(output_dir=str(tmp_path))
-    
+
+def test_generate_part_exports(exporting_service):
+    """Test the full pipeline including CAD build and STEP export."""
     part = CadPart(
         shape="box",
         dimensions=Dimensions(length=100, width=100, height=50),
@@ -37,18 +104,17 @@ def test_generate_part_with_features(tmp_path):
             Fillet(radius=5, edges="all")
         ]
     )
-    
-    result = service.generate_part(part)
-    
+
+    result = exporting_service.generate_part(part)
+
     assert result.status == "success"
     assert result.step_file_path != ""
     assert Path(result.step_file_path).exists()
+    assert Path(result.step_file_path).stat().st_size > 0
 
 
-def test_generate_part_with_custom_name(tmp_path):
+def test_generate_part_with_custom_name(service):
     """Test generating a part with a custom filename."""
-    service = PartGenerationService(output_dir=str(tmp_path))
-    
     part = CadPart(
         shape="box",
         dimensions=Dimensions(length=75, width=75, height=40)
@@ -61,47 +127,6 @@ def test_generate_part_with_custom_name(tmp_path):
     assert Path(result.step_file_path).exists()
 
 
-def test_generate_invalid_part(tmp_path):
-    """Test that invalid parts are rejected."""
-    service = PartGenerationService(output_dir=str(tmp_path))
-    
-    # Create part with holes too close together
-    part = CadPart(
-        shape="box",
-        dimensions=Dimensions(length=50, width=50, height=25),
-        holes=[
-            Hole(diameter=15, depth=20, position=Position(x=0, y=0, z=0)),
-            Hole(diameter=15, depth=20, position=Position(x=5, y=0, z=0))
-        ]
-    )
-    
-    result = service.generate_part(part)
-    
-    assert result.status == "error"
-    assert "too close" in result.message.lower()
-
-
-def test_generate_part_with_warnings(tmp_path):
-    """Test generating a part that produces warnings."""
-    service = PartGenerationService(output_dir=str(tmp_path))
-    
-    # Create part with deep hole that causes depth-to-diameter warning
-    # Depth/diameter = 60/5 = 12, which exceeds MAX_HOLE_DEPTH_RATIO of 10
-    part = CadPart(
-        shape="box",
-        dimensions=Dimensions(length=100, width=100, height=70),
-        holes=[
-            Hole(diameter=5, depth=60, position=Position(x=0, y=0, z=0))
-        ]
-    )
-    
-    result = service.generate_part(part)
-    
-    assert result.status == "success"
-    assert result.message is not None
-    assert "warning" in result.message.lower()
-
-
 def test_output_directory_creation(tmp_path):
     """Test that output directory is created if it doesn't exist."""
     test_dir = tmp_path / "test_mechanical_output"